@@ -1,10 +1,7 @@
 """
 Audit Log Controller - handles audit log retrieval for UI layers.
 """
-from Models.model_db import Database
-
-# Singleton database instance for controller
-_db = Database()
+from Models.model_db import db as _db
 
 
 def get_recent_activity(limit: int | None = 5) -> list[dict]:
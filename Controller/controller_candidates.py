@@ -1,17 +1,27 @@
 """
 Candidate Controller - handles candidate management business logic.
 """
-from Models.model_db import Database
+from contextlib import closing
+from Models.model_db import db as _db
 from Models.base import get_connection
+from Controller.controller_elections import invalidate_elections_cache
 
-# Singleton database instance for controller
-_db = Database()
+# Column names per table; the legacy schema only changes on migrations.
+_column_cache: dict[str, frozenset[str]] = {}
+
+# Candidate columns that only exist in some legacy schemas
+_OPTIONAL_CANDIDATE_COLS = ("position", "bio", "email", "phone", "platform")
+
+# Columns every candidate INSERT writes, in row order
+_CANDIDATE_BASE_COLS = ("full_name", "slogan", "photo_path", "election_id", "user_id", "vote_count")
+
+# INSERT statements keyed by the optional columns they include
+_insert_sql_cache: dict[tuple[str, ...], str] = {}
 
 
 def list_elections_options():
     """Return only upcoming or active elections for candidate assignment."""
-    elections = _db.get_all_elections()
-    return [e for e in elections if (e.get('status') or '').lower() in ('upcoming', 'active')]
+    return _db.get_all_elections(status_in=("upcoming", "active"))
 
 
 def list_candidates():
@@ -19,67 +29,127 @@ def list_candidates():
     return _db.get_all_candidates()
 
 
-def get_candidates_for_election(election_id: int) -> list[dict]:
+def get_candidates_for_election(election_id: int, limit: int | None = None, offset: int = 0,
+                                search: str | None = None, after_name: str | None = None) -> list[dict]:
     """Return candidates for a specific election.
 
     Uses raw SQL to include optional columns (position/bio/email/phone/platform)
-    when they exist in the legacy schema.
+    when they exist in the legacy schema. `search` filters by name, `limit`/`offset`
+    page the result, and `after_name` (the last name of the previous page) enables
+    keyset paging over the (election_id, full_name) index.
     """
     conn = get_connection()
     if not conn:
         return []
     try:
-        cursor = conn.cursor(dictionary=True)
-
-        optional_cols = []
-        for col in ("position", "bio", "email", "phone", "platform"):
-            if _has_column("candidates", col):
-                optional_cols.append(col)
-
-        select_cols = [
-            "candidate_id",
-            "election_id",
-            "user_id",
-            "full_name",
-            "slogan",
-            "photo_path",
-            "vote_count",
-        ] + optional_cols
-
-        cursor.execute(
-            f"SELECT {', '.join(select_cols)} FROM candidates WHERE election_id = %s ORDER BY full_name",
-            (election_id,),
-        )
-        rows = cursor.fetchall() or []
-        cursor.close()
-        conn.close()
-        return rows
+        with closing(conn), conn.cursor(dictionary=True) as cursor:
+            optional_cols = _candidate_optional_cols(cursor)
+
+            select_cols = [
+                "candidate_id",
+                "election_id",
+                "user_id",
+                "full_name",
+                "slogan",
+                "photo_path",
+                "vote_count",
+            ] + optional_cols
+
+            where = ["election_id = %s"]
+            params = [election_id]
+            if search:
+                where.append("full_name LIKE %s")
+                params.append(f"%{search.strip()}%")
+            if after_name is not None:
+                where.append("full_name > %s")
+                params.append(after_name)
+
+            sql = f"SELECT {', '.join(select_cols)} FROM candidates WHERE {' AND '.join(where)} ORDER BY full_name"
+            if limit is not None:
+                sql += " LIMIT %s OFFSET %s"
+                params.extend([int(limit), int(offset or 0)])
+
+            cursor.execute(sql, tuple(params))
+            return cursor.fetchall() or []
     except Exception:
-        try:
-            conn.close()
-        except Exception:
-            pass
         return []
 
 
-def _has_column(table: str, column: str) -> bool:
-    """Check if a column exists in a table."""
+def _fetch_columns(cursor, table: str) -> frozenset[str]:
+    """Read every column name of a table in one information_schema query."""
+    cursor.execute(
+        """
+        SELECT column_name AS column_name
+        FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = %s
+        """,
+        (table,),
+    )
+    return frozenset(
+        row["column_name"] if isinstance(row, dict) else row[0]
+        for row in cursor.fetchall()
+    )
+
+
+def _get_columns(table: str, cursor=None) -> frozenset[str]:
+    """Return the column names of a table, cached for the process lifetime.
+
+    On a cache miss the lookup runs on `cursor` when the caller already holds
+    one; only standalone calls open their own connection.
+    """
+    cached = _column_cache.get(table)
+    if cached is not None:
+        return cached
+
+    if cursor is not None:
+        try:
+            columns = _fetch_columns(cursor, table)
+        except Exception:
+            return frozenset()
+        _column_cache[table] = columns
+        return columns
+
     conn = get_connection()
     if not conn:
-        return False
+        return frozenset()
     try:
-        cursor = conn.cursor()
-        cursor.execute(f"SHOW COLUMNS FROM {table} LIKE %s", (column,))
-        exists = cursor.fetchone() is not None
-        cursor.close()
-        conn.close()
-        return exists
+        with closing(conn), conn.cursor() as cursor:
+            columns = _fetch_columns(cursor, table)
     except Exception:
-        try:
-            conn.close()
-        except Exception:
-            pass
-        return False
+        return frozenset()
+    _column_cache[table] = columns
+    return columns
+
+
+def invalidate_schema_cache(table: str | None = None) -> None:
+    """Forget cached column names (call after DDL on the table)."""
+    if table is None:
+        _column_cache.clear()
+    else:
+        _column_cache.pop(table, None)
+
+
+def _has_column(table: str, column: str, cursor=None) -> bool:
+    """Check if a column exists in a table."""
+    return column in _get_columns(table, cursor)
+
+
+def _candidate_insert_sql(optional_cols: list[str]) -> str:
+    """Return the candidate INSERT statement for this optional-column shape."""
+    key = tuple(optional_cols)
+    sql = _insert_sql_cache.get(key)
+    if sql is None:
+        col_sql = list(_CANDIDATE_BASE_COLS) + list(key)
+        placeholders = ["%s"] * len(col_sql)
+        sql = f"INSERT INTO candidates ({', '.join(col_sql)}) VALUES ({', '.join(placeholders)})"
+        _insert_sql_cache[key] = sql
+    return sql
+
+
+def _candidate_optional_cols(cursor=None) -> list[str]:
+    """Return the optional legacy candidate columns present in this schema."""
+    columns = _get_columns("candidates", cursor)
+    return [col for col in _OPTIONAL_CANDIDATE_COLS if col in columns]
 
 
 def create_candidate(data: dict) -> tuple[bool, str]:
@@ -88,73 +158,37 @@ def create_candidate(data: dict) -> tuple[bool, str]:
     if not conn:
         return False, "Database connection failed"
     try:
-        cursor = conn.cursor()
-        
-        # Fetch user name to store denormalized full_name for display
-        user_id = data.get("user_id")
-        user_name = None
-        if user_id:
-            cursor.execute("SELECT full_name FROM users WHERE user_id = %s", (user_id,))
-            row = cursor.fetchone()
-            if not row:
-                cursor.close()
-                conn.close()
-                return False, "Selected user not found"
-            user_name = row[0]
-
-        election_ids = data.get("election_ids") or []
-        if not election_ids:
-            cursor.close()
-            conn.close()
-            return False, "Select at least one election"
-
-        # Check for optional columns
-        has_position = _has_column("candidates", "position")
-        has_bio = _has_column("candidates", "bio")
-        has_email = _has_column("candidates", "email")
-        has_phone = _has_column("candidates", "phone")
-        has_platform = _has_column("candidates", "platform")
-
-        optional_cols = []
-        optional_vals = []
-        if has_position:
-            optional_cols.append("position")
-            optional_vals.append(data.get("position"))
-        if has_bio:
-            optional_cols.append("bio")
-            optional_vals.append(data.get("bio"))
-        if has_email:
-            optional_cols.append("email")
-            optional_vals.append(data.get("email"))
-        if has_phone:
-            optional_cols.append("phone")
-            optional_vals.append(data.get("phone"))
-        if has_platform:
-            optional_cols.append("platform")
-            optional_vals.append(data.get("platform"))
-
-        base_cols = ["full_name", "slogan", "photo_path", "election_id", "user_id", "vote_count"]
-        base_vals = [user_name or data.get("full_name"), data.get("slogan"), data.get("photo_path"), None, user_id, 0]
-
-        col_sql = base_cols + optional_cols
-        placeholders = ["%s"] * len(col_sql)
-
-        for eid in election_ids:
-            base_vals[3] = eid
-            cursor.execute(
-                f"INSERT INTO candidates ({', '.join(col_sql)}) VALUES ({', '.join(placeholders)})",
-                base_vals + optional_vals,
-            )
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return True, "Candidate created"
+        with closing(conn), conn.cursor() as cursor:
+            # Fetch user name to store denormalized full_name for display
+            user_id = data.get("user_id")
+            user_name = None
+            if user_id:
+                cursor.execute("SELECT full_name FROM users WHERE user_id = %s", (user_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return False, "Selected user not found"
+                user_name = row[0]
+
+            election_ids = data.get("election_ids") or []
+            if not election_ids:
+                return False, "Select at least one election"
+
+            # Check for optional columns
+            optional_cols = _candidate_optional_cols(cursor)
+            optional_vals = [data.get(col) for col in optional_cols]
+
+            # One batched INSERT for all elections instead of a round-trip per election
+            rows = [
+                [user_name or data.get("full_name"), data.get("slogan"), data.get("photo_path"), eid, user_id, 0]
+                + optional_vals
+                for eid in election_ids
+            ]
+            cursor.executemany(_candidate_insert_sql(optional_cols), rows)
+            conn.commit()
     except Exception as e:
-        try:
-            conn.close()
-        except Exception:
-            pass
         return False, f"Failed to add candidate: {e}"
+    invalidate_elections_cache()
+    return True, "Candidate created"
 
 
 def update_candidate(candidate_id: int, data: dict) -> tuple[bool, str]:
@@ -163,87 +197,60 @@ def update_candidate(candidate_id: int, data: dict) -> tuple[bool, str]:
     if not conn:
         return False, "Database connection failed"
     try:
-        cursor = conn.cursor()
-        user_id = data.get("user_id")
-        user_name = None
-        if user_id:
-            cursor.execute("SELECT full_name FROM users WHERE user_id = %s", (user_id,))
-            row = cursor.fetchone()
-            if not row:
-                cursor.close()
-                conn.close()
-                return False, "Selected user not found"
-            user_name = row[0]
-
-        election_ids = data.get("election_ids") or []
-        if not election_ids:
-            cursor.close()
-            conn.close()
-            return False, "Select at least one election"
-
-        # Detect optional columns
-        has_position = _has_column("candidates", "position")
-        has_bio = _has_column("candidates", "bio")
-        has_email = _has_column("candidates", "email")
-        has_phone = _has_column("candidates", "phone")
-        has_platform = _has_column("candidates", "platform")
-
-        optional_cols = []
-        optional_vals = []
-        if has_position:
-            optional_cols.append("position")
-            optional_vals.append(data.get("position"))
-        if has_bio:
-            optional_cols.append("bio")
-            optional_vals.append(data.get("bio"))
-        if has_email:
-            optional_cols.append("email")
-            optional_vals.append(data.get("email"))
-        if has_phone:
-            optional_cols.append("phone")
-            optional_vals.append(data.get("phone"))
-        if has_platform:
-            optional_cols.append("platform")
-            optional_vals.append(data.get("platform"))
-
-        set_clauses = ["full_name=%s", "slogan=%s", "photo_path=%s", "election_id=%s", "user_id=%s"]
-        values = [user_name or data.get("full_name"), data.get("slogan"), data.get("photo_path"), election_ids[0], user_id]
-
-        for col in optional_cols:
-            set_clauses.append(f"{col}=%s")
-        values.extend(optional_vals)
-        values.append(candidate_id)
-
-        cursor.execute(
-            f"UPDATE candidates SET {', '.join(set_clauses)} WHERE candidate_id=%s",
-            values,
-        )
-
-        # For any additional elections, insert new rows for the same user
-        extra = election_ids[1:]
-        for eid in extra:
-            base_vals = [user_name or data.get("full_name"), data.get("slogan"), data.get("photo_path"), eid, user_id, 0]
-            col_sql = ["full_name", "slogan", "photo_path", "election_id", "user_id", "vote_count"] + optional_cols
-            placeholders = ["%s"] * len(col_sql)
+        with closing(conn), conn.cursor() as cursor:
+            user_id = data.get("user_id")
+            user_name = None
+            if user_id:
+                cursor.execute("SELECT full_name FROM users WHERE user_id = %s", (user_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return False, "Selected user not found"
+                user_name = row[0]
+
+            election_ids = data.get("election_ids") or []
+            if not election_ids:
+                return False, "Select at least one election"
+
+            # Detect optional columns
+            optional_cols = _candidate_optional_cols(cursor)
+            optional_vals = [data.get(col) for col in optional_cols]
+
+            set_clauses = ["full_name=%s", "slogan=%s", "photo_path=%s", "election_id=%s", "user_id=%s"]
+            values = [user_name or data.get("full_name"), data.get("slogan"), data.get("photo_path"), election_ids[0], user_id]
+
+            for col in optional_cols:
+                set_clauses.append(f"{col}=%s")
+            values.extend(optional_vals)
+            values.append(candidate_id)
+
+            # Autocommit is off, so the UPDATE and the extra-election INSERTs share one commit
             cursor.execute(
-                f"INSERT INTO candidates ({', '.join(col_sql)}) VALUES ({', '.join(placeholders)})",
-                base_vals + optional_vals,
+                f"UPDATE candidates SET {', '.join(set_clauses)} WHERE candidate_id=%s",
+                values,
             )
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return True, "Candidate updated"
+
+            # For any additional elections, insert new rows for the same user
+            extra = election_ids[1:]
+            if extra:
+                rows = [
+                    [user_name or data.get("full_name"), data.get("slogan"), data.get("photo_path"), eid, user_id, 0]
+                    + optional_vals
+                    for eid in extra
+                ]
+                cursor.executemany(_candidate_insert_sql(optional_cols), rows)
+            conn.commit()
     except Exception as e:
-        try:
-            conn.close()
-        except Exception:
-            pass
         return False, f"Failed to update candidate: {e}"
+    invalidate_elections_cache()
+    return True, "Candidate updated"
 
 
 def delete_candidate(candidate_id: int) -> tuple[bool, str]:
     """Delete a candidate."""
-    return _db.delete_candidate(candidate_id)
+    result = _db.delete_candidate(candidate_id)
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def list_candidate_users():
@@ -2,10 +2,21 @@
 Election Controller - handles election management business logic.
 """
 from datetime import date, datetime
-from Models.model_db import Database
+from functools import lru_cache
+from Models.model_db import db as _db
+from Controller.ttl_cache import ttl_cache
+from Controller.controller_reports import invalidate_report_cache
 
-# Singleton database instance for controller
-_db = Database()
+
+@lru_cache(maxsize=256)
+def _parse_date_str(value: str):
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    except Exception:
+        return None
 
 
 def _parse_date(value):
@@ -16,35 +27,21 @@ def _parse_date(value):
     if isinstance(value, date):
         return value
     if isinstance(value, str):
-        value = value.strip()
-        if not value:
-            return None
-        try:
-            return datetime.strptime(value[:10], "%Y-%m-%d").date()
-        except Exception:
-            return None
+        return _parse_date_str(value)
     return None
 
 
-def _validate_election_dates(start_date, end_date) -> tuple[bool, str | None]:
-    today = date.today()
-    start = _parse_date(start_date)
-    end = _parse_date(end_date)
-
+def _date_error(start, end, today) -> str | None:
     if start and start < today:
-        return False, "Start date cannot be before today."
+        return "Start date cannot be before today."
     if end and end < today:
-        return False, "End date cannot be before today."
+        return "End date cannot be before today."
     if start and end and end < start:
-        return False, "End date cannot be earlier than start date."
-    return True, None
+        return "End date cannot be earlier than start date."
+    return None
 
 
-def _expected_status(start_date, end_date):
-    today = date.today()
-    start = _parse_date(start_date)
-    end = _parse_date(end_date)
-
+def _status_for_dates(start, end, today):
     if start and today < start:
         return "upcoming"
     if end and today > end:
@@ -58,11 +55,38 @@ def _expected_status(start_date, end_date):
     return None
 
 
+def _classify(start_date, end_date, *, today=None) -> tuple[bool, str | None, str | None]:
+    """Parse both dates once and return (ok, error message, expected status)."""
+    today = today or date.today()
+    start = _parse_date(start_date)
+    end = _parse_date(end_date)
+
+    error = _date_error(start, end, today)
+    if error:
+        return False, error, None
+    return True, None, _status_for_dates(start, end, today)
+
+
+def _expected_status(start_date, end_date, *, today=None):
+    today = today or date.today()
+    return _status_for_dates(_parse_date(start_date), _parse_date(end_date), today)
+
+
+def invalidate_elections_cache() -> None:
+    """Drop cached election/dashboard reads after a write."""
+    for cached in (list_elections, list_candidates, get_admin_stats, get_recent_activity,
+                   get_dashboard_chart_data, get_positions_for_election):
+        cached.cache_clear()
+    invalidate_report_cache()
+
+
+@ttl_cache(ttl=3)
 def list_elections():
     """Return elections with candidate counts."""
     return _db.get_all_elections()
 
 
+@ttl_cache(ttl=3)
 def list_candidates():
     """Return all candidates (with election_id if already assigned)."""
     return _db.get_all_candidates()
@@ -70,12 +94,12 @@ def list_candidates():
 
 def create_election(data: dict) -> tuple[bool, str]:
     """Create a new election."""
-    ok, msg = _validate_election_dates(data.get("start_date"), data.get("end_date"))
+    ok, msg, expected = _classify(data.get("start_date"), data.get("end_date"))
     if not ok:
         return False, msg
 
-    status = _expected_status(data.get("start_date"), data.get("end_date")) or data.get("status", "upcoming")
-    return _db.create_election(
+    status = expected or data.get("status", "upcoming")
+    result = _db.create_election(
         title=data.get("title"),
         description=data.get("description", ""),
         start_date=data.get("start_date"),
@@ -84,19 +108,21 @@ def create_election(data: dict) -> tuple[bool, str]:
         allowed_grade=data.get("allowed_grade"),
         allowed_section=data.get("allowed_section", "ALL"),
     )
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def update_election(election_id: int, data: dict) -> tuple[bool, str]:
     """Update election details."""
-    ok, msg = _validate_election_dates(data.get("start_date"), data.get("end_date"))
+    ok, msg, expected = _classify(data.get("start_date"), data.get("end_date"))
     if not ok:
         return False, msg
 
     status = data.get("status")
-    expected = _expected_status(data.get("start_date"), data.get("end_date"))
     if expected and status and status != expected:
         status = expected
-    return _db.update_election(
+    result = _db.update_election(
         election_id=election_id,
         title=data.get("title"),
         description=data.get("description", ""),
@@ -106,6 +132,9 @@ def update_election(election_id: int, data: dict) -> tuple[bool, str]:
         allowed_grade=data.get("allowed_grade"),
         allowed_section=data.get("allowed_section", "ALL"),
     )
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def delete_election(election_id: int) -> tuple[bool, str]:
@@ -115,7 +144,7 @@ def delete_election(election_id: int) -> tuple[bool, str]:
 
 def set_election_status(election_id: int, status: str, force: bool = False) -> tuple[bool, str]:
     """Update election status."""
-    election = _db.get_election_by_id(election_id)
+    election = _db.get_election_schedule(election_id)
     if not election:
         return False, "Election not found."
 
@@ -131,17 +160,15 @@ def set_election_status(election_id: int, status: str, force: bool = False) -> t
         if status == "upcoming":
             return False, "Cannot set to Upcoming once the election has started."
         return False, "Election status must match the configured dates."
-    return _db.update_election(
+    result = _db.update_election_status(
         election_id,
-        title=election['title'],
-        description=election.get('description', ''),
-        start_date=election.get('start_date'),
-        end_date=election.get('end_date'),
         status=status,
-        allowed_grade=election.get('allowed_grade'),
-        allowed_section=election.get('allowed_section', 'ALL'),
-        status_locked=True
+        status_locked=True,
+        title=election.get('title'),
     )
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def get_election_by_id(election_id: int) -> dict | None:
@@ -159,16 +186,19 @@ def get_election_results_by_position(election_id: int) -> dict:
     return _db.get_election_results_by_position(election_id)
 
 
+@ttl_cache(ttl=3)
 def get_admin_stats() -> dict:
     """Get admin dashboard statistics."""
     return _db.get_admin_stats()
 
 
+@ttl_cache(ttl=3)
 def get_recent_activity(limit: int | None = 5) -> list[dict]:
     """Get recent audit activity."""
     return _db.get_recent_activity(limit)
 
 
+@ttl_cache(ttl=3)
 def get_dashboard_chart_data(mode: str = "results") -> dict:
     """Get chart data for admin dashboard."""
     return _db.get_dashboard_chart_data(mode=mode)
@@ -180,6 +210,7 @@ def get_election_chart_data(election_id: int, mode: str = "results") -> dict:
 
 
 # === Position management ===
+@ttl_cache(ttl=3)
 def get_positions_for_election(election_id: int) -> list[dict]:
     """Get all positions for an election."""
     return _db.get_positions_for_election(election_id)
@@ -187,17 +218,26 @@ def get_positions_for_election(election_id: int) -> list[dict]:
 
 def create_position(election_id: int, title: str, display_order: int = 0) -> tuple[bool, str, int | None]:
     """Create a new position for an election."""
-    return _db.create_position(election_id, title, display_order)
+    result = _db.create_position(election_id, title, display_order)
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def update_position(position_id: int, title: str, display_order: int = None) -> tuple[bool, str]:
     """Update a position."""
-    return _db.update_position(position_id, title, display_order)
+    result = _db.update_position(position_id, title, display_order)
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def delete_position(position_id: int) -> tuple[bool, str]:
     """Delete a position."""
-    return _db.delete_position(position_id)
+    result = _db.delete_position(position_id)
+    if result[0]:
+        invalidate_elections_cache()
+    return result
 
 
 def get_election_ballot_data(election_id: int) -> dict:
@@ -207,4 +247,18 @@ def get_election_ballot_data(election_id: int) -> dict:
 
 def assign_candidate_to_position(candidate_id: int, position_id: int) -> tuple[bool, str]:
     """Assign a candidate to a position."""
-    return _db.assign_candidate_to_position(candidate_id, position_id)
+    result = _db.assign_candidate_to_position(candidate_id, position_id)
+    if result[0]:
+        invalidate_elections_cache()
+    return result
+
+
+def create_ballot_bulk(election_id: int, positions: list[dict]) -> tuple[bool, str, list[int]]:
+    """Create positions with their candidate assignments in one transaction.
+
+    positions: list of {"title": str, "display_order": int, "candidate_ids": list[int]}
+    """
+    result = _db.create_ballot_bulk(election_id, positions)
+    if result[0]:
+        invalidate_elections_cache()
+    return result
@@ -1,12 +1,10 @@
-from Models.model_db import Database
-from Views.main_window import MainWindow
-from Views.admin import AdminMainWindow
+from Models.model_db import db
 
 
 class LoginController:
     def __init__(self, view, signup_view=None):
         self.view = view
-        self.db = Database()
+        self.db = db
         # Keep a reference to the dashboard so it doesn't get garbage collected
         self.dashboard = None
         self.view.login_btn.clicked.connect(self.handle_login)
@@ -28,15 +26,13 @@ class LoginController:
         Normalize DB/user dict keys to what the UI expects.
 
         The SQLAlchemy User.to_dict() returns keys like 'user_id' and 'full_name',
-        while the student/admin windows expect 'id' and 'name'.
+        while the student/admin windows expect 'id' and 'name'. The dict is freshly
+        built by authenticate_user, so it is updated in place rather than copied.
         """
         user_data = user_data or {}
-        user_id = user_data.get("id") or user_data.get("user_id")
-        name = user_data.get("name") or user_data.get("full_name") or user_data.get("username")
-        normalized = dict(user_data)
-        normalized["id"] = user_id
-        normalized["name"] = name
-        return normalized
+        user_data.setdefault("id", user_data.get("user_id"))
+        user_data.setdefault("name", user_data.get("full_name") or user_data.get("username"))
+        return user_data
 
     def handle_login(self):
         username = self.view.get_username().strip()
@@ -58,10 +54,13 @@ class LoginController:
             user_role = user_data.get("role", "student") if user_data else "student"
             
             if user_role == "admin":
-                # Show admin panel for admin users
+                # Show admin panel for admin users; dashboards are imported on
+                # demand so the login screen doesn't pay for both widget trees
+                from Views.admin import AdminMainWindow
                 self.dashboard = AdminMainWindow(user_data, on_logout=self._logout_to_login)
             else:
                 # Show regular student dashboard
+                from Views.main_window import MainWindow
                 self.dashboard = MainWindow(user_data, on_logout=self._logout_to_login)
             
             self.dashboard.show()
@@ -1,18 +1,259 @@
-
+"""
+Report Controller - gathers election report data and exports it as PDF, CSV and Excel.
+
+Where the time goes: one report is a handful of indexed queries, then object
+construction in matplotlib (chart rasterizing and PNG encoding), ReportLab
+(Table/Paragraph layout) and openpyxl (row writes). That allocation and I/O is
+the hot path, so tune the figure/PNG, flowable and workbook code; the small
+dict/int bookkeeping around it (stats, integrity counters) is not worth
+micro-optimizing.
+"""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from operator import itemgetter
 from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
 from Models.base import get_connection
-from Models.model_db import Database
 import csv
+import heapq
 import os
+import textwrap
+import time
+
+# One voting record as returned by _SQL_RECORDS (same column order)
+VotingRow = namedtuple("VotingRow", (
+    "record_id user_id voter_username voter_name voter_student_id voter_email "
+    "voter_grade voter_section voter_role voter_created_at election_id election_title "
+    "position_id position_title candidate_id candidate_name vote_status voted_at"
+))
+
+
+def _row_getter(*fields):
+    """itemgetter pulling the named VotingRow fields in one C-level call."""
+    return itemgetter(*(VotingRow._fields.index(f) for f in fields))
+
+
+# Columns of the CSV audit-log section, in output order
+_csv_record_cols = _row_getter(
+    "record_id", "user_id", "voter_username", "voter_name", "voter_student_id",
+    "voter_email", "voter_grade", "voter_section", "position_id", "position_title",
+    "candidate_id", "candidate_name", "vote_status", "voted_at",
+)
+
+# Raw values behind the PDF audit-log table cells
+_pdf_record_cols = _row_getter(
+    "record_id", "voter_name", "voter_username", "voter_student_id", "voter_email",
+    "voter_grade", "voter_section", "position_title", "candidate_name", "vote_status",
+    "voted_at",
+)
+
+# Chart label wrappers, built once instead of a TextWrapper per textwrap.fill call
+_wrap_position_label = textwrap.TextWrapper(width=14).fill
+_wrap_candidate_label = textwrap.TextWrapper(width=32).fill
+
+# Report queries are fixed text, so they are built once at import (only the
+# eligible-voter count varies per election).
+# Same columns, in the same order, as the CSV audit-log section
+_SQL_VR_FOR_CSV = """
+    SELECT
+        vr.record_id,
+        vr.user_id,
+        u.username,
+        u.full_name,
+        u.student_id,
+        u.email,
+        u.grade_level,
+        u.section,
+        vr.position_id,
+        COALESCE(p.title, 'Unassigned'),
+        vr.candidate_id,
+        c.full_name,
+        vr.status,
+        vr.voted_at
+    FROM voting_records vr
+    LEFT JOIN users u ON u.user_id = vr.user_id
+    LEFT JOIN positions p ON p.position_id = vr.position_id
+    LEFT JOIN candidates c ON c.candidate_id = vr.candidate_id
+    WHERE vr.election_id = %s
+    ORDER BY vr.voted_at DESC
+"""
+
+# Cheap change marker for an election's votes; answered from idx_vr_elec_cand alone
+_SQL_SIGNATURE = """
+    SELECT COUNT(*) AS n, MAX(record_id) AS last_id
+    FROM voting_records
+    WHERE election_id = %s
+"""
+
+_SQL_DROP_SNAPSHOT = "DROP TEMPORARY TABLE IF EXISTS tmp_report_votes"
+
+_SQL_ELECTION = """
+    SELECT election_id, title, description, status, start_date, end_date,
+           allowed_grade, allowed_section
+    FROM elections
+    WHERE election_id = %s
+"""
+
+_SQL_POSITIONS = """
+    SELECT position_id, election_id, title, display_order, created_at
+    FROM positions
+    WHERE election_id = %s
+    ORDER BY display_order ASC, position_id ASC
+"""
+
+_SQL_SNAPSHOT = """
+    CREATE TEMPORARY TABLE tmp_report_votes AS
+    SELECT
+        vr.record_id,
+        vr.user_id,
+        vr.election_id,
+        vr.position_id,
+        vr.candidate_id,
+        vr.status,
+        vr.voted_at,
+        u.user_id AS voter_user_id,
+        u.username AS voter_username,
+        u.full_name AS voter_name,
+        u.student_id AS voter_student_id,
+        u.email AS voter_email,
+        u.grade_level AS voter_grade,
+        u.section AS voter_section,
+        u.role AS voter_role,
+        u.created_at AS voter_created_at,
+        p.position_id AS known_position_id,
+        p.title AS position_title,
+        c.candidate_id AS known_candidate_id,
+        c.full_name AS candidate_name
+    FROM voting_records vr
+    LEFT JOIN users u ON u.user_id = vr.user_id
+    LEFT JOIN positions p ON p.position_id = vr.position_id
+    LEFT JOIN candidates c ON c.candidate_id = vr.candidate_id
+    WHERE vr.election_id = %s
+"""
+
+_SQL_CANDIDATES = """
+    SELECT c.candidate_id, c.election_id, c.position_id,
+           COALESCE(p.title, c.position, 'Unassigned') AS position_title,
+           c.full_name, c.slogan, c.email, c.phone,
+           COALESCE(v.vote_total, 0) AS actual_votes
+    FROM candidates c
+    LEFT JOIN positions p ON p.position_id = c.position_id
+    LEFT JOIN (
+        SELECT candidate_id, COUNT(*) AS vote_total
+        FROM tmp_report_votes
+        WHERE candidate_id IS NOT NULL
+        GROUP BY candidate_id
+    ) v ON v.candidate_id = c.candidate_id
+    WHERE c.election_id = %s
+"""
+
+_SQL_RECORDS = """
+    SELECT
+        record_id,
+        user_id,
+        voter_username,
+        voter_name,
+        voter_student_id,
+        voter_email,
+        voter_grade,
+        voter_section,
+        voter_role,
+        voter_created_at,
+        election_id,
+        %s AS election_title,
+        position_id,
+        COALESCE(position_title, 'Unassigned') AS position_title,
+        candidate_id,
+        candidate_name,
+        status AS vote_status,
+        voted_at
+    FROM tmp_report_votes
+"""
+
+_SQL_VOTERS = """
+    SELECT
+        voter_user_id AS user_id,
+        voter_username AS username,
+        voter_name AS full_name,
+        voter_student_id AS student_id,
+        voter_email AS email,
+        voter_grade AS grade_level,
+        voter_section AS section,
+        voter_role AS role,
+        voter_created_at AS user_created_at,
+        MAX(voted_at) AS voted_at
+    FROM tmp_report_votes
+    WHERE voter_user_id IS NOT NULL
+    GROUP BY voter_user_id, voter_username, voter_name, voter_student_id, voter_email,
+             voter_grade, voter_section, voter_role, voter_created_at
+    ORDER BY voted_at DESC
+"""
+
+_SQL_TOTALS = """
+    SELECT
+        COUNT(*) AS total_records,
+        SUM(CASE WHEN status='cast' THEN 1 ELSE 0 END) AS cast_records,
+        SUM(CASE WHEN status='spoiled' THEN 1 ELSE 0 END) AS spoiled_records,
+        COUNT(DISTINCT user_id) AS distinct_voters,
+        SUM(CASE WHEN status='cast' AND candidate_id IS NULL THEN 1 ELSE 0 END)
+            AS cast_missing_candidate,
+        SUM(CASE WHEN voter_user_id IS NULL THEN 1 ELSE 0 END) AS orphan_user_votes,
+        SUM(CASE WHEN candidate_id IS NOT NULL AND known_candidate_id IS NULL THEN 1 ELSE 0 END)
+            AS orphan_candidate_votes,
+        SUM(CASE WHEN position_id IS NOT NULL AND known_position_id IS NULL THEN 1 ELSE 0 END)
+            AS orphan_position_votes
+    FROM tmp_report_votes
+"""
+
+_SQL_POSITION_SUMMARY = """
+    SELECT
+        p.position_id,
+        p.title AS position_title,
+        COUNT(vr.record_id) AS total_ballots,
+        SUM(CASE WHEN vr.status='cast' THEN 1 ELSE 0 END) AS cast_ballots,
+        SUM(CASE WHEN vr.status='spoiled' THEN 1 ELSE 0 END) AS spoiled_ballots,
+        COUNT(DISTINCT vr.user_id) AS distinct_voters
+    FROM positions p
+    LEFT JOIN tmp_report_votes vr ON vr.position_id = p.position_id
+    WHERE p.election_id = %s
+    GROUP BY p.position_id, p.title
+    ORDER BY p.display_order ASC, p.position_id ASC
+"""
+
+
+def write_voting_records_csv(writer, election_id: int) -> None:
+    """
+    Write an election's voting records to a csv.writer straight from an
+    unbuffered tuple cursor; rows never become Python dicts or lists.
+    """
+    conn = get_connection()
+    if not conn:
+        raise RuntimeError("Database connection failed")
+    with closing(conn), conn.cursor(buffered=False) as cursor:
+        cursor.execute(_SQL_VR_FOR_CSV, (election_id,))
+        writer.writerows(cursor)
+
 
-# Singleton database instance
-_db = Database()
+# Gathered report data keyed by (election_id, include_records), holding
+# (vote signature, expiry, result). Exporting PDF/Excel/CSV back-to-back reuses
+# one gather while no vote has been recorded; the TTL bounds staleness for edits
+# that the vote signature cannot see (eligible users, candidate details).
+_REPORT_CACHE_TTL = 60.0
+_report_cache: dict[tuple[int, bool], tuple[tuple, float, dict]] = {}
 
 
-def get_full_election_report_data(election_id: int) -> dict:
+def invalidate_report_cache() -> None:
+    """Drop cached report data after a write that changes what a report shows."""
+    _report_cache.clear()
+
+
+def get_full_election_report_data(election_id: int, include_records: bool = True) -> dict:
     """
     Gather ALL raw data for a comprehensive election report.
     Returns dict with full voting records, candidates, voters info.
+    With include_records=False, "voting_records" is left as None and the CSV
+    export streams the rows through write_voting_records_csv() instead.
     """
     result = {
         "success": False,
@@ -33,247 +274,152 @@ def get_full_election_report_data(election_id: int) -> dict:
         return result
 
     try:
-        cursor = conn.cursor(dictionary=True)
-
-        # Get election info
-        cursor.execute(
-            """
-            SELECT election_id, title, description, status, start_date, end_date,
-                   allowed_grade, allowed_section
-            FROM elections
-            WHERE election_id = %s
-            """,
-            (election_id,),
-        )
-        election = cursor.fetchone()
-        if not election:
-            result["error"] = "Election not found"
-            cursor.close()
-            conn.close()
-            return result
-
-        result["election"] = election
-
-        # Get positions for this election (ordered)
-        cursor.execute(
-            """
-            SELECT position_id, election_id, title, display_order, created_at
-            FROM positions
-            WHERE election_id = %s
-            ORDER BY display_order ASC, position_id ASC
-            """,
-            (election_id,),
-        )
-        result["positions"] = cursor.fetchall() or []
-
-        # Get ALL candidates with full details
-        cursor.execute(
-            """
-            SELECT c.candidate_id, c.election_id, c.position_id,
-                   COALESCE(p.title, c.position, 'Unassigned') AS position_title,
-                   c.full_name, c.slogan, c.bio, c.email, c.phone,
-                   c.platform, c.photo_path, c.vote_count,
-                   COALESCE(v.vote_total, 0) AS actual_votes
-            FROM candidates c
-            LEFT JOIN positions p ON p.position_id = c.position_id
-            LEFT JOIN (
-                SELECT candidate_id, COUNT(*) AS vote_total
-                FROM voting_records
-                WHERE candidate_id IS NOT NULL
-                GROUP BY candidate_id
-            ) v ON v.candidate_id = c.candidate_id
-            WHERE c.election_id = %s
-            ORDER BY position_title ASC, actual_votes DESC, c.full_name ASC
-            """,
-            (election_id,),
-        )
-        result["candidates"] = cursor.fetchall()
-
-        # Get ALL voting records with voter and candidate details
-        cursor.execute(
-            """
-            SELECT 
-                vr.record_id,
-                vr.user_id,
-                u.username AS voter_username,
-                u.full_name AS voter_name,
-                u.student_id AS voter_student_id,
-                u.email AS voter_email,
-                u.grade_level AS voter_grade,
-                u.section AS voter_section,
-                vr.election_id,
-                e.title AS election_title,
-                vr.position_id,
-                COALESCE(p.title, 'Unassigned') AS position_title,
-                vr.candidate_id,
-                c.full_name AS candidate_name,
-                vr.status AS vote_status,
-                vr.voted_at
-            FROM voting_records vr
-            LEFT JOIN users u ON u.user_id = vr.user_id
-            LEFT JOIN elections e ON e.election_id = vr.election_id
-            LEFT JOIN positions p ON p.position_id = vr.position_id
-            LEFT JOIN candidates c ON c.candidate_id = vr.candidate_id
-            WHERE vr.election_id = %s
-            ORDER BY vr.voted_at DESC
-            """,
-            (election_id,),
-        )
-        result["voting_records"] = cursor.fetchall()
-
-        # Get ALL voters who participated
-        cursor.execute(
-            """
-            SELECT DISTINCT
-                u.user_id,
-                u.username,
-                u.full_name,
-                u.student_id,
-                u.email,
-                u.grade_level,
-                u.section,
-                u.role,
-                u.created_at AS user_created_at,
-                vr.voted_at
-            FROM users u
-            INNER JOIN voting_records vr ON vr.user_id = u.user_id
-            WHERE vr.election_id = %s
-            ORDER BY vr.voted_at DESC
-            """,
-            (election_id,),
-        )
-        result["voters"] = cursor.fetchall()
-
-        # ------------------------------------------------------------------
-        # STATS (turnout, cast/spoiled, eligibility)
-        # ------------------------------------------------------------------
-        allowed_grade = election.get("allowed_grade")
-        allowed_section = (election.get("allowed_section") or "").strip()
-
-        eligible_query = "SELECT COUNT(*) AS cnt FROM users WHERE role='student'"
-        eligible_params = []
-        if allowed_grade is not None:
-            eligible_query += " AND grade_level = %s"
-            eligible_params.append(allowed_grade)
-        if allowed_section and allowed_section.upper() != "ALL":
-            eligible_query += " AND UPPER(COALESCE(section,'')) = UPPER(%s)"
-            eligible_params.append(allowed_section)
-
-        cursor.execute(eligible_query, tuple(eligible_params))
-        eligible_voters = int((cursor.fetchone() or {}).get("cnt") or 0)
-
-        cursor.execute(
-            """
-            SELECT
-                COUNT(*) AS total_records,
-                SUM(CASE WHEN status='cast' THEN 1 ELSE 0 END) AS cast_records,
-                SUM(CASE WHEN status='spoiled' THEN 1 ELSE 0 END) AS spoiled_records,
-                COUNT(DISTINCT user_id) AS distinct_voters
-            FROM voting_records
-            WHERE election_id = %s
-            """,
-            (election_id,),
-        )
-        row = cursor.fetchone() or {}
-        total_records = int(row.get("total_records") or 0)
-        cast_records = int(row.get("cast_records") or 0)
-        spoiled_records = int(row.get("spoiled_records") or 0)
-        distinct_voters = int(row.get("distinct_voters") or 0)
-
-        turnout_pct = (distinct_voters / eligible_voters * 100.0) if eligible_voters > 0 else 0.0
-        result["stats"] = {
-            "eligible_voters": eligible_voters,
-            "participants": distinct_voters,
-            "turnout_pct": turnout_pct,
-            "total_records": total_records,
-            "cast_records": cast_records,
-            "spoiled_records": spoiled_records,
-        }
-
-        # Per-position summary
-        cursor.execute(
-            """
-            SELECT
-                p.position_id,
-                p.title AS position_title,
-                COUNT(vr.record_id) AS total_ballots,
-                SUM(CASE WHEN vr.status='cast' THEN 1 ELSE 0 END) AS cast_ballots,
-                SUM(CASE WHEN vr.status='spoiled' THEN 1 ELSE 0 END) AS spoiled_ballots,
-                COUNT(DISTINCT vr.user_id) AS distinct_voters
-            FROM positions p
-            LEFT JOIN voting_records vr
-                ON vr.position_id = p.position_id AND vr.election_id = p.election_id
-            WHERE p.election_id = %s
-            GROUP BY p.position_id, p.title
-            ORDER BY p.display_order ASC, p.position_id ASC
-            """,
-            (election_id,),
-        )
-        result["stats"]["positions"] = cursor.fetchall() or []
-
-        # ------------------------------------------------------------------
-        # INTEGRITY CHECKS (professional audit counters)
-        # ------------------------------------------------------------------
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS cnt
-            FROM voting_records
-            WHERE election_id=%s AND status='cast' AND (candidate_id IS NULL)
-            """,
-            (election_id,),
-        )
-        cast_missing_candidate = int((cursor.fetchone() or {}).get("cnt") or 0)
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS cnt
-            FROM voting_records vr
-            LEFT JOIN users u ON u.user_id = vr.user_id
-            WHERE vr.election_id=%s AND u.user_id IS NULL
-            """,
-            (election_id,),
-        )
-        orphan_user_votes = int((cursor.fetchone() or {}).get("cnt") or 0)
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS cnt
-            FROM voting_records vr
-            LEFT JOIN candidates c ON c.candidate_id = vr.candidate_id
-            WHERE vr.election_id=%s AND vr.candidate_id IS NOT NULL AND c.candidate_id IS NULL
-            """,
-            (election_id,),
-        )
-        orphan_candidate_votes = int((cursor.fetchone() or {}).get("cnt") or 0)
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS cnt
-            FROM voting_records vr
-            LEFT JOIN positions p ON p.position_id = vr.position_id
-            WHERE vr.election_id=%s AND vr.position_id IS NOT NULL AND p.position_id IS NULL
-            """,
-            (election_id,),
-        )
-        orphan_position_votes = int((cursor.fetchone() or {}).get("cnt") or 0)
-
-        result["integrity"] = {
-            "cast_missing_candidate": cast_missing_candidate,
-            "orphan_user_votes": orphan_user_votes,
-            "orphan_candidate_votes": orphan_candidate_votes,
-            "orphan_position_votes": orphan_position_votes,
-        }
-
-        result["success"] = True
-        cursor.close()
-        conn.close()
+        with closing(conn), conn.cursor(dictionary=True) as cursor:
+
+            # Serve a recent gather for this election if no vote has landed since
+            cursor.execute(_SQL_SIGNATURE, (election_id,))
+            sig = cursor.fetchone() or {}
+            signature = (sig.get("n"), sig.get("last_id"))
+            cache_key = (election_id, include_records)
+            hit = _report_cache.get(cache_key)
+            if hit is not None and hit[0] == signature and hit[1] > time.monotonic():
+                # Shallow copy so callers can annotate it (e.g. prepared_by)
+                cached = dict(hit[2])
+                cached["generated_at"] = result["generated_at"]
+                return cached
+
+            # Get election info
+            cursor.execute(_SQL_ELECTION, (election_id,))
+            election = cursor.fetchone()
+            if not election:
+                result["error"] = "Election not found"
+                return result
+
+            result["election"] = election
+
+            # Get positions for this election (ordered)
+            cursor.execute(_SQL_POSITIONS, (election_id,))
+            result["positions"] = cursor.fetchall() or []
+
+            # Snapshot this election's votes (with voter/position/candidate details)
+            # once; every aggregate below reads the snapshot instead of re-scanning
+            # voting_records. Temporary tables are per-session and are dropped when
+            # the pool resets the connection.
+            cursor.execute(_SQL_DROP_SNAPSHOT)
+            cursor.execute(_SQL_SNAPSHOT, (election_id,))
+
+            # Get ALL candidates with full details
+            cursor.execute(_SQL_CANDIDATES, (election_id,))
+            # Rank in Python: sorting on the COALESCE'd title would force a filesort
+            # COUNT() arrives as Decimal/None depending on the driver; normalize once
+            # so every consumer can use actual_votes as a plain int
+            candidates = cursor.fetchall()
+            for c in candidates:
+                c["actual_votes"] = int(c["actual_votes"] or 0)
+            candidates.sort(key=lambda c: (
+                (c["position_title"] or "").lower(),
+                -c["actual_votes"],
+                (c["full_name"] or "").lower(),
+            ))
+            result["candidates"] = candidates
+
+            # Get ALL voting records with voter and candidate details
+            if include_records:
+                # Plain tuples wrapped in VotingRow: no per-row dict for what can be
+                # tens of thousands of rows. The full list is still built, since the
+                # CSV, Excel and PDF writers each walk every row; mapping the cursor
+                # only skips fetchall()'s intermediate list of raw tuples
+                with conn.cursor() as rows_cursor:
+                    rows_cursor.execute(_SQL_RECORDS, (election.get("title"),))
+                    records = list(map(VotingRow._make, rows_cursor))
+                records.sort(key=lambda r: r.voted_at or datetime.min, reverse=True)
+                result["voting_records"] = records
+            else:
+                result["voting_records"] = None
+
+            # Get ALL voters who participated. When the records are loaded they
+            # already carry the voter columns, newest first, so the first row per
+            # user is their latest vote; orphaned records have no username.
+            if include_records:
+                voters = {}
+                for r in records:
+                    uid = r.user_id
+                    if uid in voters or r.voter_username is None:
+                        continue
+                    voters[uid] = {
+                        "user_id": uid,
+                        "username": r.voter_username,
+                        "full_name": r.voter_name,
+                        "student_id": r.voter_student_id,
+                        "email": r.voter_email,
+                        "grade_level": r.voter_grade,
+                        "section": r.voter_section,
+                        "role": r.voter_role,
+                        "user_created_at": r.voter_created_at,
+                        "voted_at": r.voted_at,
+                    }
+                result["voters"] = list(voters.values())
+            else:
+                cursor.execute(_SQL_VOTERS)
+                result["voters"] = cursor.fetchall()
+
+            # ------------------------------------------------------------------
+            # STATS (turnout, cast/spoiled, eligibility)
+            # ------------------------------------------------------------------
+            allowed_grade = election.get("allowed_grade")
+            allowed_section = (election.get("allowed_section") or "").strip()
+
+            eligible_query = "SELECT COUNT(*) AS cnt FROM users WHERE role='student'"
+            eligible_params = []
+            if allowed_grade is not None:
+                eligible_query += " AND grade_level = %s"
+                eligible_params.append(allowed_grade)
+            if allowed_section and allowed_section.upper() != "ALL":
+                # Column collation is case-insensitive, so a bare comparison matches
+                # like UPPER() did while staying usable by idx_users_elig
+                eligible_query += " AND section = %s"
+                eligible_params.append(allowed_section)
+
+            cursor.execute(eligible_query, tuple(eligible_params))
+            eligible_voters = int((cursor.fetchone() or {}).get("cnt") or 0)
+
+            # Totals and integrity counters share one pass over the snapshot; a plain
+            # tuple cursor is enough for a single row of counters
+            with conn.cursor() as counts:
+                counts.execute(_SQL_TOTALS)
+                (total_records, cast_records, spoiled_records, distinct_voters,
+                 cast_missing_candidate, orphan_user_votes, orphan_candidate_votes,
+                 orphan_position_votes) = (int(v or 0) for v in counts.fetchone())
+
+            turnout_pct = (distinct_voters / eligible_voters * 100.0) if eligible_voters > 0 else 0.0
+            result["stats"] = {
+                "eligible_voters": eligible_voters,
+                "participants": distinct_voters,
+                "turnout_pct": turnout_pct,
+                "total_records": total_records,
+                "cast_records": cast_records,
+                "spoiled_records": spoiled_records,
+            }
+
+            # Per-position summary
+            cursor.execute(_SQL_POSITION_SUMMARY, (election_id,))
+            result["stats"]["positions"] = cursor.fetchall() or []
+
+            # ------------------------------------------------------------------
+            # INTEGRITY CHECKS (professional audit counters)
+            # ------------------------------------------------------------------
+            result["integrity"] = {
+                "cast_missing_candidate": cast_missing_candidate,
+                "orphan_user_votes": orphan_user_votes,
+                "orphan_candidate_votes": orphan_candidate_votes,
+                "orphan_position_votes": orphan_position_votes,
+            }
+
+            result["success"] = True
+            _report_cache[cache_key] = (signature, time.monotonic() + _REPORT_CACHE_TTL, dict(result))
 
     except Exception as e:
         result["error"] = str(e)
-        try:
-            conn.close()
-        except Exception:
-            pass
 
     return result
 
@@ -291,19 +437,22 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
         from reportlab.lib.pagesizes import A4, landscape
         from reportlab.lib import colors
         from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
+        from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table, LongTable,
                                         TableStyle, Image, PageBreak, KeepTogether)
         from reportlab.lib.units import mm
         from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.graphics.shapes import Drawing, String
+        from reportlab.graphics.charts.barcharts import VerticalBarChart
+        from reportlab.graphics.charts.piecharts import Pie
     except ImportError:
         return False, "reportlab library not installed. Install with: pip install reportlab"
 
     # Check for matplotlib
     have_mpl = True
     try:
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from PIL import Image as PILImage
         from io import BytesIO
     except ImportError:
         have_mpl = False
@@ -437,6 +586,68 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
             except Exception:
                 return 0.0
 
+        CHART_TEXT = colors.HexColor('#374151')
+
+        def _chart_canvas(title, width, height):
+            d = Drawing(width, height)
+            d.add(String(width / 2.0, height - 12, title, textAnchor='middle',
+                         fontName='Helvetica-Bold', fontSize=10, fillColor=CHART_TEXT))
+            return d
+
+        def _bar_drawing(title, labels, values, bar_colors, width, height, empty_text=None):
+            """Vertical bar chart with value labels, drawn as PDF vectors."""
+            d = _chart_canvas(title, width, height)
+            if empty_text and not values:
+                d.add(String(width / 2.0, height / 2.0, empty_text, textAnchor='middle', fontSize=9))
+                return d
+            bc = VerticalBarChart()
+            bc.x, bc.y = 30, 30
+            bc.width, bc.height = width - 40, height - 56
+            bc.data = [list(values)]
+            bc.categoryAxis.categoryNames = list(labels)
+            bc.categoryAxis.labels.fontSize = 7
+            bc.categoryAxis.labels.fillColor = CHART_TEXT
+            bc.valueAxis.valueMin = 0
+            if not any(values):
+                bc.valueAxis.valueMax = 1
+            bc.valueAxis.labels.fontSize = 7
+            bc.valueAxis.visibleGrid = True
+            bc.valueAxis.gridStrokeColor = colors.HexColor('#E5E7EB')
+            bc.valueAxis.gridStrokeDashArray = (2, 2)
+            bc.bars.strokeColor = None
+            for i, c in enumerate(bar_colors):
+                bc.bars[(0, i)].fillColor = colors.HexColor(c)
+            bc.barLabelFormat = '%d'
+            bc.barLabels.fontSize = 7
+            bc.barLabels.fillColor = CHART_TEXT
+            bc.barLabels.nudge = 6
+            d.add(bc)
+            return d
+
+        def _donut_drawing(title, labels, values, slice_colors, width, height):
+            """Donut chart with percentage labels, drawn as PDF vectors."""
+            d = _chart_canvas(title, width, height)
+            total = sum(values)
+            if total <= 0:
+                d.add(String(width / 2.0, height / 2.0, "No Ballot Data", textAnchor='middle', fontSize=9))
+                return d
+            shown = [(l, v, c) for l, v, c in zip(labels, values, slice_colors) if v > 0]
+            size = min(width, height - 24) - 36
+            pie = Pie()
+            pie.x, pie.y = (width - size) / 2.0, (height - 24 - size) / 2.0
+            pie.width = pie.height = size
+            pie.data = [v for _, v, _ in shown]
+            pie.labels = [f"{l} {v / total * 100:.1f}%" for l, v, _ in shown]
+            pie.startAngle = 90
+            pie.innerRadiusFraction = 0.58
+            pie.slices.strokeColor = colors.white
+            pie.slices.fontSize = 7
+            pie.slices.fontColor = CHART_TEXT
+            for i, (_, _, c) in enumerate(shown):
+                pie.slices[i].fillColor = colors.HexColor(c)
+            d.add(pie)
+            return d
+
         # Header/footer for all pages
         def _draw_header_footer(canvas, doc_obj):
             canvas.saveState()
@@ -571,9 +782,8 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
         # ==============================================================================
         # 2. SUMMARY CARDS
         # ==============================================================================
-        total_votes = sum((c.get('votes') or c.get('actual_votes') or 0) for c in candidates)
-        if total_votes == 0 and records:
-            total_votes = sum(1 for r in records if (r.get('vote_status') or '').lower() == 'cast')
+        # Cast count comes straight from the report aggregates, not a rescan of the rows
+        cast_votes = int(stats.get("cast_records") or 0)
         total_candidates = len(candidates)
         participants = int(stats.get("participants") or len(voters) or 0)
         eligible_voters = int(stats.get("eligible_voters") or 0)
@@ -592,7 +802,7 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                 p("TURNOUT", card_label_style),
             ],
             [
-                p(str(int(stats.get("cast_records") or total_votes)), card_val_style),
+                p(str(cast_votes), card_val_style),
                 p(str(spoiled_votes), ParagraphStyle('SpoiledVal', parent=card_val_style, textColor=ACCENT_COLOR)),
                 p(str(participants), card_val_style),
                 p(f"{turnout_pct:.1f}%", ParagraphStyle('TurnoutVal', parent=card_val_style, textColor=ACCENT_COLOR)),
@@ -611,12 +821,40 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
         elems.append(card_table)
         elems.append(Spacer(1, 10 * mm))
 
+        # Build helpers: candidates by position, bucketed once for the winners chart,
+        # the winners table and the detailed tables. Candidates arrive ranked by
+        # (position title, votes desc), so every bucket is already in vote order.
+        # Each candidate is reduced once to an (upper-cased name, position title,
+        # votes) row
+        from collections import defaultdict
+        cand_rows = [
+            ((c.get('full_name') or '').upper(),
+             str(c.get('position_title') or c.get('position') or 'Unassigned'),
+             c['actual_votes'])
+            for c in candidates
+        ]
+        # Vote totals per bucket are summed in the same pass and shared by the
+        # winners table and the detailed tables
+        c_by_pos = defaultdict(list)
+        pos_totals = defaultdict(int)
+        for c, row in zip(candidates, cand_rows):
+            pos_key = c.get('position_id') or c.get('position_title') or 'Unassigned'
+            c_by_pos[pos_key].append(row)
+            pos_totals[pos_key] += row[2]
+        # Fallback when the election has no Position records: group by text title
+        by_title = defaultdict(list)
+        title_totals = defaultdict(int)
+        if not positions:
+            for row in cand_rows:
+                by_title[row[1]].append(row)
+                title_totals[row[1]] += row[2]
+
         # ==============================================================================
         # 3. VISUALIZATIONS (Charts)
         # ==============================================================================
-        if have_mpl and (candidates or records):
+        detail_charts = None
+        if candidates or records:
             try:
-                # --- Chart A: Participation overview (bar) ---
                 eligible = int(stats.get("eligible_voters") or 0)
                 participants = int(stats.get("participants") or len(voters) or 0)
                 cast_votes = int(stats.get("cast_records") or 0)
@@ -626,182 +864,51 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                 page_w = float(doc.width)  # points
                 col_w = page_w / 3.0
 
-                def _img(buf, width_pts: float, aspect: float):
-                    """Create an Image preserving aspect ratio (avoid stretch)."""
-                    w = float(width_pts)
-                    h = max(1.0, w * float(aspect))
-                    return Image(buf, width=w, height=h)
-
-                buf_overview = BytesIO()
-                # Match figure aspect to the Image to avoid stretching
-                fig_overview = (6.0, 4.0)
-                plt.figure(figsize=fig_overview)
-                cats = ["Eligible", "Participants", "Cast", "Spoiled"]
-                vals = [eligible, participants, cast_votes, spoiled_votes]
-                colors_bars = ['#10B981', '#34D399', '#059669', '#F59E0B']
-                bars = plt.bar(cats, vals, color=colors_bars)
-                plt.title('Participation Overview', fontsize=12, fontweight='bold', color='#374151')
-                plt.ylabel('Count', fontsize=9, color='#374151')
-                plt.grid(axis='y', linestyle='--', alpha=0.25)
-                plt.gca().spines['top'].set_visible(False)
-                plt.gca().spines['right'].set_visible(False)
-                plt.xticks(fontsize=9)
-                plt.yticks(fontsize=8)
-                for b, v in zip(bars, vals):
-                    plt.text(b.get_x() + b.get_width() / 2, b.get_height(), str(int(v)), ha='center', va='bottom', fontsize=8, color='#374151')
-                plt.tight_layout(pad=1.0)
-                plt.savefig(buf_overview, format='png', dpi=220, transparent=True, bbox_inches='tight', pad_inches=0.12)
-                plt.close('all')
-                buf_overview.seek(0)
+                # --- Chart A: Participation overview (bar) ---
+                # The top-row charts are plain bars and a donut, so they are drawn as
+                # native PDF vectors rather than rasterized through matplotlib
+                img_overview = _bar_drawing(
+                    'Participation Overview',
+                    ["Eligible", "Participants", "Cast", "Spoiled"],
+                    [eligible, participants, cast_votes, spoiled_votes],
+                    ['#10B981', '#34D399', '#059669', '#F59E0B'],
+                    col_w, col_w * 4.0 / 6.0,
+                )
 
                 # --- Chart B: Ballot quality (donut) ---
-                buf_quality = BytesIO()
-                fig_quality = (5.0, 4.0)
-                plt.figure(figsize=fig_quality)
-                q_labels = ["Cast", "Spoiled"]
-                q_vals = [max(0, cast_votes), max(0, spoiled_votes)]
-                q_colors = ['#10B981', '#F59E0B']
-                if sum(q_vals) > 0:
-                    plt.pie(q_vals, labels=q_labels, autopct='%1.1f%%',
-                            startangle=90, pctdistance=0.78,
-                            colors=q_colors, wedgeprops=dict(width=0.42, edgecolor='white'))
-                    plt.title('Ballot Quality', fontsize=12, fontweight='bold', color='#374151')
-                else:
-                    plt.text(0.5, 0.5, "No Ballot Data", ha='center', va='center')
-                    plt.axis('off')
-                plt.tight_layout(pad=1.0)
-                plt.savefig(buf_quality, format='png', dpi=220, transparent=True, bbox_inches='tight', pad_inches=0.12)
-                plt.close('all')
-                buf_quality.seek(0)
-
-                # --- Chart B: Winner votes per position (bar) ---
-                from collections import defaultdict
-                c_by_pos = defaultdict(list)
-                for c in candidates:
-                    pos_key = c.get('position_id') or c.get('position_title') or 'Unassigned'
-                    c_by_pos[pos_key].append(c)
+                img_quality = _donut_drawing(
+                    'Ballot Quality',
+                    ["Cast", "Spoiled"],
+                    [max(0, cast_votes), max(0, spoiled_votes)],
+                    ['#10B981', '#F59E0B'],
+                    col_w, col_w * 4.0 / 5.0,
+                )
 
+                # --- Chart C: Winner votes per position (bar) ---
+                # The first row of each ranked bucket is its winner
                 pos_labels = []
                 pos_winner_votes = []
                 if positions:
                     for pos in positions:
-                        pos_id = pos.get('position_id')
-                        pos_title = pos.get('title') or pos.get('position_title') or 'Unassigned'
-                        group = c_by_pos.get(pos_id) or []
+                        group = c_by_pos.get(pos.get('position_id'))
                         if not group:
                             continue
-                        top_votes = max(int(g.get('actual_votes') or 0) for g in group)
-                        pos_labels.append(str(pos_title))
-                        pos_winner_votes.append(top_votes)
+                        pos_labels.append(str(pos.get('title') or pos.get('position_title') or 'Unassigned'))
+                        pos_winner_votes.append(group[0][2])
                 else:
                     # Fallback: group by text
-                    by_title = defaultdict(list)
-                    for c in candidates:
-                        by_title[str(c.get('position_title') or c.get('position') or 'Unassigned')].append(c)
-                    for title in sorted(by_title.keys()):
-                        group = by_title[title]
-                        top_votes = max(int(g.get('actual_votes') or 0) for g in group)
-                        pos_labels.append(str(title))
-                        pos_winner_votes.append(top_votes)
-
-                buf_winners = BytesIO()
-                fig_winners = (7.5, 4.0)
-                plt.figure(figsize=fig_winners)
-                if pos_labels and pos_winner_votes:
-                    import textwrap
-                    wrapped = [textwrap.fill(str(x), width=18) for x in pos_labels]
-                    bars = plt.bar(wrapped, pos_winner_votes, color='#10B981')
-                    plt.title('Winning Votes per Position', fontsize=12, fontweight='bold', color='#374151')
-                    plt.ylabel('Votes', fontsize=9, color='#374151')
-                    plt.xticks(rotation=0, ha='center', fontsize=8)
-                    plt.yticks(fontsize=8)
-                    plt.grid(axis='y', linestyle='--', alpha=0.25)
-                    plt.gca().spines['top'].set_visible(False)
-                    plt.gca().spines['right'].set_visible(False)
-                    for b, v in zip(bars, pos_winner_votes):
-                        plt.text(b.get_x() + b.get_width() / 2, b.get_height(), str(int(v)), ha='center', va='bottom', fontsize=7, color='#374151')
-                else:
-                    plt.text(0.5, 0.5, "No Position Data", ha='center', va='center')
-                    plt.axis('off')
-                plt.tight_layout(pad=1.0)
-                plt.savefig(buf_winners, format='png', dpi=220, transparent=True, bbox_inches='tight', pad_inches=0.12)
-                plt.close('all')
-                buf_winners.seek(0)
-
-                # --- Chart D: Top candidates (barh) ---
-                top = sorted(
-                    candidates,
-                    key=lambda c: max(0, int(c.get('actual_votes') or c.get('votes') or 0)),
-                    reverse=True
-                )[:10]
-                buf_top = BytesIO()
-                fig_top = (10.5, 5.0)
-                plt.figure(figsize=fig_top)
-                if top:
-                    labels = []
-                    vals = []
-                    for c in top:
-                        name = str(c.get('full_name') or 'Unknown')
-                        pos = str(c.get('position_title') or c.get('position') or 'Unassigned')
-                        labels.append(f"{name} ({pos})")
-                        vals.append(max(0, int(c.get('actual_votes') or c.get('votes') or 0)))
-                    import textwrap
-                    labels = [textwrap.fill(l, width=32) for l in labels]
-                    bars = plt.barh(list(reversed(labels)), list(reversed(vals)), color='#10B981')
-                    plt.title('Top Candidates (by Votes)', fontsize=12, fontweight='bold', color='#374151')
-                    plt.xlabel('Votes', fontsize=9, color='#374151')
-                    plt.xticks(fontsize=8)
-                    plt.yticks(fontsize=7)
-                    plt.grid(axis='x', linestyle='--', alpha=0.25)
-                    plt.gca().spines['top'].set_visible(False)
-                    plt.gca().spines['right'].set_visible(False)
-                    for b in bars:
-                        plt.text(b.get_width() + 0.2, b.get_y() + b.get_height() / 2, str(int(b.get_width())), va='center', fontsize=7, color='#374151')
-                else:
-                    plt.text(0.5, 0.5, "No Candidate Data", ha='center', va='center')
-                    plt.axis('off')
-                plt.tight_layout(pad=1.0)
-                plt.savefig(buf_top, format='png', dpi=220, transparent=True, bbox_inches='tight', pad_inches=0.12)
-                plt.close('all')
-                buf_top.seek(0)
-
-                # --- Chart C: Votes by rank (line) ---
-                cand_votes_sorted = sorted(
-                    [max(0, int(c.get('actual_votes') or c.get('votes') or 0)) for c in candidates],
-                    reverse=True
+                    for title in sorted(by_title):
+                        pos_labels.append(title)
+                        pos_winner_votes.append(by_title[title][0][2])
+
+                img_winners = _bar_drawing(
+                    'Winning Votes per Position',
+                    [_wrap_position_label(x) for x in pos_labels],
+                    pos_winner_votes,
+                    ['#10B981'] * len(pos_winner_votes),
+                    col_w, col_w * 4.0 / 7.5,
+                    empty_text="No Position Data",
                 )
-                buf_rank = BytesIO()
-                fig_rank = (10.5, 3.6)
-                plt.figure(figsize=fig_rank)
-                if cand_votes_sorted:
-                    x = list(range(1, len(cand_votes_sorted) + 1))
-                    plt.plot(x, cand_votes_sorted, color='#10B981', marker='o', linewidth=2)
-                    plt.fill_between(x, cand_votes_sorted, color='#10B981', alpha=0.12)
-                    plt.title('Competitiveness (Votes by Candidate Rank)', fontsize=11, fontweight='bold', color='#374151')
-                    plt.xlabel('Candidate Rank (highest to lowest)', fontsize=8)
-                    plt.ylabel('Votes', fontsize=8)
-                    if len(x) > 20:
-                        step = max(1, len(x) // 10)
-                        plt.xticks(x[::step], fontsize=7)
-                    else:
-                        plt.xticks(fontsize=7)
-                    plt.yticks(fontsize=7)
-                    plt.grid(axis='y', linestyle='--', alpha=0.25)
-                    plt.gca().spines['top'].set_visible(False)
-                    plt.gca().spines['right'].set_visible(False)
-                else:
-                    plt.text(0.5, 0.5, "No Candidate Votes", ha='center', va='center')
-                    plt.axis('off')
-                plt.tight_layout(pad=1.0)
-                plt.savefig(buf_rank, format='png', dpi=220, transparent=True, bbox_inches='tight', pad_inches=0.12)
-                plt.close('all')
-                buf_rank.seek(0)
-
-                img_overview = _img(buf_overview, col_w, fig_overview[1] / fig_overview[0])
-                img_quality = _img(buf_quality, col_w, fig_quality[1] / fig_quality[0])
-                img_winners = _img(buf_winners, col_w, fig_winners[1] / fig_winners[0])
-                img_rank = _img(buf_rank, page_w, fig_rank[1] / fig_rank[0])
-                img_top = _img(buf_top, page_w, fig_top[1] / fig_top[0])
 
                 top_row = Table([[img_overview, img_quality, img_winners]], colWidths=[col_w, col_w, col_w])
                 top_row.setStyle(TableStyle([
@@ -817,17 +924,116 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                     top_row,
                 ]))
 
-                elems.append(PageBreak())
-                elems.append(Paragraph("Competitiveness", h2_style))
-                elems.append(Paragraph("Votes by candidate rank (higher rank = more votes).", td_style))
-                elems.append(Spacer(1, 3 * mm))
-                elems.append(img_rank)
-                elems.append(Spacer(1, 6 * mm))
-
-                # Requirement: move the Top Candidates header to the next page
-                elems.append(PageBreak())
-                elems.append(Paragraph("Top Candidates", h2_style))
-                elems.append(img_top)
+                if have_mpl:
+                    # The two full-width matplotlib charts only need the candidates, so
+                    # they render on a worker thread while the remaining tables are
+                    # built; their flowables are spliced back in at this position
+                    fig_top = (10.5, 5.0)
+                    fig_rank = (10.5, 3.6)
+
+                    def _img(buf, width_pts: float, aspect: float):
+                        """Create an Image preserving aspect ratio (avoid stretch)."""
+                        w = float(width_pts)
+                        h = max(1.0, w * float(aspect))
+                        return Image(buf, width=w, height=h)
+
+                    def _render_detail_charts():
+                        # One Figure/Agg canvas is reused for every chart instead of a
+                        # fresh pyplot figure (and renderer) per chart
+                        fig = Figure()
+                        FigureCanvasAgg(fig)
+                        # Transparent background set once on the reused figure (clf keeps
+                        # the figure patch) rather than by savefig(transparent=True) on
+                        # every save
+                        fig.patch.set_alpha(0.0)
+
+                        def _new_axes(size):
+                            fig.clf()
+                            fig.set_size_inches(*size)
+                            ax = fig.add_subplot(111)
+                            ax.set_facecolor('none')
+                            return ax
+
+                        def _render():
+                            # tight_layout already fits the axes to the canvas, so save the
+                            # figure as-is; bbox_inches='tight' would draw it a second time
+                            # just to measure the bounding box
+                            fig.tight_layout(pad=1.0)
+                            buf = BytesIO()
+                            # This PNG is decoded again straight away, so it is barely compressed
+                            fig.savefig(buf, format='png', dpi=150, pad_inches=0,
+                                        pil_kwargs={'compress_level': 1})
+                            buf.seek(0)
+                            # The charts use a handful of flat colours, so a 16-colour palette
+                            # PNG is visually identical and a fraction of the RGBA size. The
+                            # image is only embedded in the PDF (which deflates it again), so a
+                            # light compression level beats optimize=True's exhaustive search
+                            out = BytesIO()
+                            PILImage.open(buf).convert('RGBA').quantize(
+                                colors=16, method=PILImage.Quantize.FASTOCTREE
+                            ).save(out, 'PNG', compress_level=3)
+                            out.seek(0)
+                            return out
+
+                        # --- Chart D: Top candidates (barh) ---
+                        # actual_votes is already an int per candidate, so only the ten
+                        # leaders are selected instead of sorting the whole list
+                        top = heapq.nlargest(10, candidates, key=itemgetter('actual_votes'))
+                        ax = _new_axes(fig_top)
+                        if top:
+                            labels = []
+                            vals = []
+                            for c in top:
+                                name = str(c.get('full_name') or 'Unknown')
+                                pos = str(c.get('position_title') or c.get('position') or 'Unassigned')
+                                labels.append(f"{name} ({pos})")
+                                vals.append(c['actual_votes'])
+                            labels = [_wrap_candidate_label(l) for l in labels]
+                            bars = ax.barh(list(reversed(labels)), list(reversed(vals)), color='#10B981')
+                            ax.set_title('Top Candidates (by Votes)', fontsize=12, fontweight='bold', color='#374151')
+                            ax.set_xlabel('Votes', fontsize=9, color='#374151')
+                            ax.tick_params(axis='x', labelsize=8)
+                            ax.tick_params(axis='y', labelsize=7)
+                            ax.grid(axis='x', linestyle='--', alpha=0.25)
+                            ax.spines['top'].set_visible(False)
+                            ax.spines['right'].set_visible(False)
+                            ax.bar_label(bars, fmt='%d', padding=2, fontsize=7, color='#374151')
+                        else:
+                            ax.text(0.5, 0.5, "No Candidate Data", ha='center', va='center')
+                            ax.axis('off')
+                        buf_top = _render()
+
+                        # --- Chart C: Votes by rank (line) ---
+                        cand_votes_sorted = sorted(
+                            [c['actual_votes'] for c in candidates],
+                            reverse=True
+                        )
+                        ax = _new_axes(fig_rank)
+                        if cand_votes_sorted:
+                            x = list(range(1, len(cand_votes_sorted) + 1))
+                            ax.plot(x, cand_votes_sorted, color='#10B981', marker='o', linewidth=2)
+                            ax.fill_between(x, cand_votes_sorted, color='#10B981', alpha=0.12)
+                            ax.set_title('Competitiveness (Votes by Candidate Rank)', fontsize=11, fontweight='bold', color='#374151')
+                            ax.set_xlabel('Candidate Rank (highest to lowest)', fontsize=8)
+                            ax.set_ylabel('Votes', fontsize=8)
+                            if len(x) > 20:
+                                step = max(1, len(x) // 10)
+                                ax.set_xticks(x[::step])
+                            ax.tick_params(axis='x', labelsize=7)
+                            ax.tick_params(axis='y', labelsize=7)
+                            ax.grid(axis='y', linestyle='--', alpha=0.25)
+                            ax.spines['top'].set_visible(False)
+                            ax.spines['right'].set_visible(False)
+                        else:
+                            ax.text(0.5, 0.5, "No Candidate Votes", ha='center', va='center')
+                            ax.axis('off')
+                        buf_rank = _render()
+                        return buf_top, buf_rank
+
+                    chart_pool = ThreadPoolExecutor(max_workers=1)
+                    detail_charts = chart_pool.submit(_render_detail_charts)
+                    chart_pool.shutdown(wait=False)
+                    detail_charts_at = len(elems)
 
             except Exception:
                 elems.append(Paragraph("Charts unavailable for this report run.", td_style))
@@ -875,117 +1081,116 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
         # ============================================================================== 
         elems.append(Paragraph("3. Position Winners", h2_style))
 
-        # Build helpers: candidates by position
-        from collections import defaultdict
-        c_by_pos = defaultdict(list)
-        for c in candidates:
-            pos_key = c.get('position_id') or c.get('position_title') or 'Unassigned'
-            c_by_pos[pos_key].append(c)
-
-        winner_rows = [["POSITION", "WINNER", "VOTES", "PCT (POSITION)"]]
-        for pos in (positions or []):
-            pos_id = pos.get('position_id')
-            pos_title = pos.get('title') or pos.get('position_title') or 'Unassigned'
-            group = c_by_pos.get(pos_id) or []
-            group_sorted = sorted(group, key=lambda x: int(x.get('actual_votes') or 0), reverse=True)
-            if not group_sorted:
-                winner_rows.append([pos_title, "-", "0", "0.0%"])
-                continue
-            top_votes = int(group_sorted[0].get('actual_votes') or 0)
-            tied = [g for g in group_sorted if int(g.get('actual_votes') or 0) == top_votes]
-            winner_name = ", ".join([str(t.get('full_name') or '-').upper() for t in tied])
-            pos_total = sum(int(g.get('actual_votes') or 0) for g in group_sorted)
-            pct = (top_votes / pos_total * 100.0) if pos_total > 0 else 0.0
-            if len(tied) > 1:
-                winner_name = f"TIE: {winner_name}"
-            winner_rows.append([pos_title, winner_name, str(top_votes), f"{pct:.1f}%"])
-
-        # Include any candidates that are unassigned to a Position record
-        if c_by_pos and positions:
-            known_ids = {p.get('position_id') for p in positions}
-            extras = [k for k in c_by_pos.keys() if isinstance(k, int) and k not in known_ids]
-            if extras:
-                for k in extras:
-                    group = c_by_pos.get(k) or []
-                    group_sorted = sorted(group, key=lambda x: int(x.get('actual_votes') or 0), reverse=True)
-                    pos_title = str(group_sorted[0].get('position_title') or 'Unassigned')
-                    top_votes = int(group_sorted[0].get('actual_votes') or 0) if group_sorted else 0
-                    tied = [g for g in group_sorted if int(g.get('actual_votes') or 0) == top_votes]
-                    winner_name = ", ".join([str(t.get('full_name') or '-').upper() for t in tied]) if tied else "-"
-                    pos_total = sum(int(g.get('actual_votes') or 0) for g in group_sorted)
-                    pct = (top_votes / pos_total * 100.0) if pos_total > 0 else 0.0
-                    if len(tied) > 1:
-                        winner_name = f"TIE: {winner_name}"
-                    winner_rows.append([pos_title, winner_name, str(top_votes), f"{pct:.1f}%"])
-
-        winners_table = Table(winner_rows, colWidths=[70 * mm, 120 * mm, 25 * mm, 35 * mm], repeatRows=1)
-        winners_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),
-            ('TEXTCOLOR', (0, 0), (-1, 0), HEADER_TEXT),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#E5E7EB')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, ZEBRA_BG]),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        elems.append(winners_table)
-        elems.append(Spacer(1, 10))
-
-        elems.append(Paragraph("4. Detailed Results (By Position)", h2_style))
-
-        col_widths = [18 * mm, 55 * mm, 95 * mm, 30 * mm, 35 * mm]
-        headers = ["RANK", "POSITION", "CANDIDATE", "VOTES", "PCT"]
-
-        # Render one compact table per position for readability
-        def _render_position_table(position_title: str, group: list[dict]):
-            group_sorted = sorted(group, key=lambda x: int(x.get('actual_votes') or 0), reverse=True)
-            pos_total = sum(int(g.get('actual_votes') or 0) for g in group_sorted)
-            table_data = [headers]
-            for i, c in enumerate(group_sorted, 1):
-                v = int(c.get('actual_votes') or 0)
-                pct = (v / pos_total * 100.0) if pos_total > 0 else 0.0
-                table_data.append([
-                    p(f"#{i}", td_center_style),
-                    p(str(position_title), td_style),
-                    p(str(c.get('full_name') or 'Unknown').upper(),
-                      ParagraphStyle('CandName', parent=td_style, fontName='Helvetica-Bold')),
-                    p(str(v), ParagraphStyle('Votes', parent=td_center_style, fontName='Helvetica-Bold', textColor=PRIMARY_COLOR)),
-                    p(f"{pct:.1f}%", td_center_style),
-                ])
-
-            t = Table(table_data, colWidths=col_widths, repeatRows=1)
-            t.setStyle(TableStyle([
+        if int(stats.get("cast_records") or 0) == 0:
+            # Nothing has been cast yet, so every position would tabulate as zeros;
+            # skip building the winners and per-position tables altogether
+            elems.append(Paragraph("No votes have been cast yet.", td_style))
+            elems.append(Spacer(1, 10))
+        else:
+            winner_rows = [["POSITION", "WINNER", "VOTES", "PCT (POSITION)"]]
+            for pos in (positions or []):
+                pos_id = pos.get('position_id')
+                pos_title = pos.get('title') or pos.get('position_title') or 'Unassigned'
+                group_sorted = c_by_pos.get(pos_id) or []
+                if not group_sorted:
+                    winner_rows.append([pos_title, "-", "0", "0.0%"])
+                    continue
+                top_votes = group_sorted[0][2]
+                tied = [name for name, _, v in group_sorted if v == top_votes]
+                winner_name = ", ".join([name or '-' for name in tied])
+                pos_total = pos_totals[pos_id]
+                pct = (top_votes / pos_total * 100.0) if pos_total > 0 else 0.0
+                if len(tied) > 1:
+                    winner_name = f"TIE: {winner_name}"
+                winner_rows.append([pos_title, winner_name, str(top_votes), f"{pct:.1f}%"])
+
+            # Include any candidates that are unassigned to a Position record
+            if c_by_pos and positions:
+                known_ids = {p.get('position_id') for p in positions}
+                extras = [k for k in c_by_pos.keys() if isinstance(k, int) and k not in known_ids]
+                if extras:
+                    for k in extras:
+                        group_sorted = c_by_pos.get(k) or []
+                        pos_title = group_sorted[0][1]
+                        top_votes = group_sorted[0][2] if group_sorted else 0
+                        tied = [name for name, _, v in group_sorted if v == top_votes]
+                        winner_name = ", ".join([name or '-' for name in tied]) if tied else "-"
+                        pos_total = pos_totals[k]
+                        pct = (top_votes / pos_total * 100.0) if pos_total > 0 else 0.0
+                        if len(tied) > 1:
+                            winner_name = f"TIE: {winner_name}"
+                        winner_rows.append([pos_title, winner_name, str(top_votes), f"{pct:.1f}%"])
+
+            winners_table = Table(winner_rows, colWidths=[70 * mm, 120 * mm, 25 * mm, 35 * mm], repeatRows=1)
+            winners_table.setStyle(TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),
                 ('TEXTCOLOR', (0, 0), (-1, 0), HEADER_TEXT),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
                 ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
                 ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#E5E7EB')),
                 ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, ZEBRA_BG]),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
                 ('TOPPADDING', (0, 0), (-1, -1), 6),
                 ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
             ]))
-            elems.append(t)
-            elems.append(Spacer(1, 8))
-
-        if positions:
-            for pos in positions:
-                pos_id = pos.get('position_id')
-                pos_title = pos.get('title') or pos.get('position_title') or 'Unassigned'
-                group = c_by_pos.get(pos_id) or []
-                if not group:
-                    continue
-                _render_position_table(pos_title, group)
-        else:
-            # Fallback: group by text title
-            by_title = defaultdict(list)
-            for c in candidates:
-                by_title[str(c.get('position_title') or c.get('position') or 'Unassigned')].append(c)
-            for title in sorted(by_title.keys()):
-                _render_position_table(title, by_title[title])
+            elems.append(winners_table)
+            elems.append(Spacer(1, 10))
+
+            elems.append(Paragraph("4. Detailed Results (By Position)", h2_style))
+
+            col_widths = [18 * mm, 55 * mm, 95 * mm, 30 * mm, 35 * mm]
+            headers = ["RANK", "POSITION", "CANDIDATE", "VOTES", "PCT"]
+            cand_name_style = ParagraphStyle('CandName', parent=td_style, fontName='Helvetica-Bold')
+
+            # Render one compact table per position for readability
+            def _render_position_table(position_title: str, group_sorted: list[tuple], pos_total: int):
+                table_data = [headers]
+                for i, (name, _, v) in enumerate(group_sorted, 1):
+                    pct = (v / pos_total * 100.0) if pos_total > 0 else 0.0
+                    # Rank, votes and pct are short single-line values, so they are plain
+                    # string cells styled through the TableStyle below
+                    table_data.append([
+                        f"#{i}",
+                        p(str(position_title), td_style),
+                        p(name or 'UNKNOWN', cand_name_style),
+                        str(v),
+                        f"{pct:.1f}%",
+                    ])
+
+                t = Table(table_data, colWidths=col_widths, repeatRows=1)
+                t.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), HEADER_TEXT),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 9),
+                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                    ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#E5E7EB')),
+                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, ZEBRA_BG]),
+                    ('FONTSIZE', (0, 1), (-1, -1), 9),
+                    ('TEXTCOLOR', (0, 1), (-1, -1), TEXT_COLOR),
+                    ('ALIGN', (0, 1), (0, -1), 'CENTER'),
+                    ('ALIGN', (3, 1), (4, -1), 'CENTER'),
+                    ('FONTNAME', (3, 1), (3, -1), 'Helvetica-Bold'),
+                    ('TEXTCOLOR', (3, 1), (3, -1), PRIMARY_COLOR),
+                    ('TOPPADDING', (0, 0), (-1, -1), 6),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ]))
+                elems.append(t)
+                elems.append(Spacer(1, 8))
+
+            if positions:
+                for pos in positions:
+                    pos_id = pos.get('position_id')
+                    pos_title = pos.get('title') or pos.get('position_title') or 'Unassigned'
+                    group = c_by_pos.get(pos_id) or []
+                    if not group:
+                        continue
+                    _render_position_table(pos_title, group, pos_totals[pos_id])
+            else:
+                # Fallback: group by text title
+                for title in sorted(by_title.keys()):
+                    _render_position_table(title, by_title[title], title_totals[title])
 
         # ============================================================================== 
         # 6. VOTING RECORDS (Complex Table)
@@ -1013,28 +1218,32 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
 
         rec_rows = [rec_headers]
 
-        for r in records:
-            v_date = str(r.get('voted_at', ''))
-            voted_for = r.get('candidate_name', '')
+        # Only the free-text columns need Paragraph wrapping; everything else is a
+        # plain string cell, which ReportLab draws without running its markup parser
+        cand_style = ParagraphStyle('CandSmall', parent=td_style, textColor=colors.HexColor('#047857'))
+
+        def wrap(text, style=td_style):
+            return Paragraph(xml_escape(str(text)), style) if text else '-'
+
+        for (record_id, voter_name, voter_username, student_id, email, grade, section,
+             position_title, voted_for, vote_status, voted_at) in map(_pdf_record_cols, records):
             if not voted_for:
-                voted_for = '-' if (r.get('vote_status') or '').lower() == 'cast' else 'SPOILED'
-
-            row = [
-                p(str(r.get('record_id', '')), td_center_style),
-                p(r.get('voter_name', r.get('voter_username', '')), td_style),
-                p(str(r.get('voter_student_id', '')), td_style),
-                p(r.get('voter_email', '') or '-', td_style),
-                p(str(r.get('voter_grade', '')), td_center_style),
-                p(str(r.get('voter_section', '')), td_style),
-                p(r.get('position_title', '') or '-', td_style),
-                p(voted_for,
-                  ParagraphStyle('CandSmall', parent=td_style, textColor=colors.HexColor('#047857'))),
-                p(r.get('vote_status', '').upper(), td_center_style),
-                p(v_date, td_style),
-            ]
-            rec_rows.append(row)
+                voted_for = '-' if (vote_status or '').lower() == 'cast' else 'SPOILED'
+
+            rec_rows.append([
+                str(record_id),
+                wrap(voter_name or voter_username),
+                str(student_id),
+                wrap(email),
+                str(grade),
+                str(section),
+                wrap(position_title),
+                wrap(voted_for, cand_style),
+                (vote_status or '').upper(),
+                str(voted_at),
+            ])
 
-        rec_table = Table(rec_rows, colWidths=rec_col_widths, repeatRows=1)
+        rec_table = LongTable(rec_rows, colWidths=rec_col_widths, repeatRows=1)
         rec_table.setStyle(TableStyle([
             # Header Row Style
             ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),  # Light Green
@@ -1047,12 +1256,42 @@ def generate_pdf_report(report_data: dict, file_path: str) -> tuple[bool, str]:
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
             ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#E5E7EB')),
             ('ROWBACKGROUNDS', (1, 0), (-1, -1), [colors.white, ZEBRA_BG]),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('TEXTCOLOR', (0, 1), (-1, -1), TEXT_COLOR),
+            ('ALIGN', (0, 1), (0, -1), 'CENTER'),
+            ('ALIGN', (4, 1), (4, -1), 'CENTER'),
+            ('ALIGN', (8, 1), (8, -1), 'CENTER'),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
         ]))
         elems.append(rec_table)
 
+        # Splice in the worker-rendered charts now that the tables are built
+        if detail_charts is not None:
+            try:
+                buf_top, buf_rank = detail_charts.result()
+                detail_elems = []
+                img_rank = _img(buf_rank, page_w, fig_rank[1] / fig_rank[0])
+                img_top = _img(buf_top, page_w, fig_top[1] / fig_top[0])
+
+                detail_elems.append(PageBreak())
+                detail_elems.append(Paragraph("Competitiveness", h2_style))
+                detail_elems.append(Paragraph("Votes by candidate rank (higher rank = more votes).", td_style))
+                detail_elems.append(Spacer(1, 3 * mm))
+                detail_elems.append(img_rank)
+                detail_elems.append(Spacer(1, 6 * mm))
+
+                # Requirement: move the Top Candidates header to the next page
+                detail_elems.append(PageBreak())
+                detail_elems.append(Paragraph("Top Candidates", h2_style))
+                detail_elems.append(img_top)
+            except Exception:
+                detail_elems = [
+                    Paragraph("Charts unavailable for this report run.", td_style),
+                    Spacer(1, 6 * mm),
+                ]
+            elems[detail_charts_at:detail_charts_at] = detail_elems
+
         doc.build(elems, onFirstPage=_draw_header_footer, onLaterPages=_draw_header_footer)
         return True, f"PDF report saved to: {file_path}"
 
@@ -1078,17 +1317,24 @@ def export_full_reports(election_id: int, output_path: str, prepared_by: str | N
     if prepared_by:
         report_data["prepared_by"] = str(prepared_by)
 
-    # 1. Generate CSVs
-    ok, msg_csv = generate_csv_report(report_data, csv_entry_path)
+    # The three writers only read report_data, so they run side by side; their
+    # file writes and zlib/PNG compression release the GIL
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        csv_job = pool.submit(generate_csv_report, report_data, csv_entry_path)
+        excel_job = pool.submit(generate_excel_report, report_data, excel_path)
+        pdf_job = pool.submit(generate_pdf_report, report_data, pdf_path)
+
+    # 1. CSVs
+    ok, msg_csv = csv_job.result()
     if not ok:
         return False, f"CSV generation failed: {msg_csv}"
 
-    # 2. Generate Excel
-    ok_x, msg_x = generate_excel_report(report_data, excel_path)
+    # 2. Excel
+    ok_x, msg_x = excel_job.result()
     excel_msg = f"Excel saved: {excel_path}" if ok_x else f"Excel warning: {msg_x}"
 
-    # 3. Generate PDF
-    ok_p, msg_p = generate_pdf_report(report_data, pdf_path)
+    # 3. PDF
+    ok_p, msg_p = pdf_job.result()
     if not ok_p: return False, f"PDF generation failed: {msg_p}"
 
     return True, (
@@ -1114,7 +1360,8 @@ def generate_csv_report(report_data: dict, file_path: str) -> tuple[bool, str]:
     integrity = report_data.get("integrity", {})
 
     try:
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        # A 1 MiB buffer keeps the row-at-a-time csv writes off the syscall path
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # Section: Election Summary
@@ -1138,20 +1385,22 @@ def generate_csv_report(report_data: dict, file_path: str) -> tuple[bool, str]:
             # Section: Positions
             writer.writerow(["SECTION", "POSITIONS"])
             writer.writerow(["position_id", "title", "display_order", "created_at"])
-            for p in positions:
-                writer.writerow([
+            writer.writerows(
+                (
                     p.get("position_id"),
                     p.get("title"),
                     p.get("display_order"),
                     p.get("created_at"),
-                ])
+                )
+                for p in positions
+            )
             writer.writerow([])
 
             # Section: Candidates
             writer.writerow(["SECTION", "CANDIDATES"])
             writer.writerow(["rank", "candidate_id", "position", "full_name", "slogan", "email", "phone", "votes"])
-            for i, c in enumerate(candidates, 1):
-                writer.writerow([
+            writer.writerows(
+                (
                     i,
                     c.get("candidate_id"),
                     c.get("position_title") or c.get("position") or "Unassigned",
@@ -1160,7 +1409,9 @@ def generate_csv_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                     c.get("email") or "",
                     c.get("phone") or "",
                     c.get("actual_votes") or 0,
-                ])
+                )
+                for i, c in enumerate(candidates, 1)
+            )
             writer.writerow([])
 
             # Section: Voting Records (Audit Log)
@@ -1171,23 +1422,11 @@ def generate_csv_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                 "position_id", "position_title",
                 "candidate_id", "candidate_name", "status", "voted_at"
             ])
-            for r in records:
-                writer.writerow([
-                    r.get("record_id"),
-                    r.get("user_id"),
-                    r.get("voter_username"),
-                    r.get("voter_name"),
-                    r.get("voter_student_id"),
-                    r.get("voter_email"),
-                    r.get("voter_grade"),
-                    r.get("voter_section"),
-                    r.get("position_id"),
-                    r.get("position_title"),
-                    r.get("candidate_id"),
-                    r.get("candidate_name"),
-                    r.get("vote_status"),
-                    r.get("voted_at"),
-                ])
+            if records is None:
+                # Report was gathered without records; stream them straight into the file
+                write_voting_records_csv(writer, election.get("election_id"))
+            else:
+                writer.writerows(map(_csv_record_cols, records))
             writer.writerow([])
 
             # Section: Participants
@@ -1196,8 +1435,8 @@ def generate_csv_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                 "user_id", "username", "full_name", "student_id", "email",
                 "grade_level", "section", "role", "user_created_at", "last_voted_at"
             ])
-            for v in voters:
-                writer.writerow([
+            writer.writerows(
+                (
                     v.get("user_id"),
                     v.get("username"),
                     v.get("full_name"),
@@ -1208,7 +1447,9 @@ def generate_csv_report(report_data: dict, file_path: str) -> tuple[bool, str]:
                     v.get("role"),
                     v.get("user_created_at"),
                     v.get("voted_at"),
-                ])
+                )
+                for v in voters
+            )
 
         return True, f"CSV created: {os.path.basename(file_path)}"
     except Exception as e:
@@ -1220,6 +1461,7 @@ def generate_excel_report(report_data: dict, file_path: str) -> tuple[bool, str]
         return False, report_data.get("error", "No data available")
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, Alignment, PatternFill
         from openpyxl.utils import get_column_letter
 
@@ -1235,29 +1477,33 @@ def generate_excel_report(report_data: dict, file_path: str) -> tuple[bool, str]
         header_font = Font(bold=True)
         wrap = Alignment(wrap_text=True, vertical="top")
 
+        header_align = Alignment(horizontal="center", vertical="center")
+
+        def _cell(ws, value, **style):
+            cell = WriteOnlyCell(ws, value=value)
+            for attr, val in style.items():
+                setattr(cell, attr, val)
+            return cell
+
         def write_table(ws, headers, rows):
-            ws.append(headers)
-            for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            for row in rows:
-                ws.append(row)
-            # basic sizing
+            # Write-only sheets stream rows to disk, so sizing and styles have to
+            # be set before (or while) each row is appended
             for col_idx in range(1, len(headers) + 1):
                 col_letter = get_column_letter(col_idx)
                 ws.column_dimensions[col_letter].width = min(45, max(12, len(str(headers[col_idx - 1])) + 2))
-            for r in ws.iter_rows(min_row=2):
-                for cell in r:
-                    cell.alignment = wrap
+            ws.append([_cell(ws, h, fill=header_fill, font=header_font, alignment=header_align) for h in headers])
+            for row in rows:
+                ws.append([_cell(ws, v, alignment=wrap) for v in row])
 
-        wb = Workbook()
+        # Write-only mode streams each row out instead of keeping a Cell object per
+        # value in memory, which is what dominated large VotingRecords exports
+        wb = Workbook(write_only=True)
 
         # Summary sheet
-        ws = wb.active
-        ws.title = "Summary"
-        ws.append(["Election Full Detail Report"])
-        ws["A1"].font = Font(bold=True, size=14)
+        ws = wb.create_sheet("Summary")
+        ws.column_dimensions["A"].width = 35
+        ws.column_dimensions["B"].width = 60
+        ws.append([_cell(ws, "Election Full Detail Report", font=Font(bold=True, size=14))])
         ws.append([])
         ws.append(["Title", election.get("title", "")])
         ws.append(["Status", election.get("status", "")])
@@ -1275,8 +1521,6 @@ def generate_excel_report(report_data: dict, file_path: str) -> tuple[bool, str]
         ws.append(["Integrity - Missing user", int(integrity.get("orphan_user_votes") or 0)])
         ws.append(["Integrity - Missing candidate", int(integrity.get("orphan_candidate_votes") or 0)])
         ws.append(["Integrity - Missing position", int(integrity.get("orphan_position_votes") or 0)])
-        ws.column_dimensions["A"].width = 35
-        ws.column_dimensions["B"].width = 60
 
         # Positions sheet
         ws_pos = wb.create_sheet("Positions")
@@ -1311,18 +1555,18 @@ def generate_excel_report(report_data: dict, file_path: str) -> tuple[bool, str]
                 "grade", "section", "position", "candidate", "status", "voted_at"
             ],
             [[
-                r.get("record_id"),
-                r.get("user_id"),
-                r.get("voter_username"),
-                r.get("voter_name"),
-                r.get("voter_student_id"),
-                r.get("voter_email"),
-                r.get("voter_grade"),
-                r.get("voter_section"),
-                r.get("position_title") or "",
-                r.get("candidate_name") or "",
-                r.get("vote_status"),
-                str(r.get("voted_at")),
+                r.record_id,
+                r.user_id,
+                r.voter_username,
+                r.voter_name,
+                r.voter_student_id,
+                r.voter_email,
+                r.voter_grade,
+                r.voter_section,
+                r.position_title or "",
+                r.candidate_name or "",
+                r.vote_status,
+                str(r.voted_at),
             ] for r in records],
         )
 
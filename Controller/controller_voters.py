@@ -1,40 +1,54 @@
 """
 Voter Controller - handles voter management business logic.
 """
-from Models.model_db import Database
+from contextlib import closing
+from Models.model_db import db as _db
 from Models.base import get_connection
+from Controller.ttl_cache import ttl_cache
+from Controller.controller_elections import invalidate_elections_cache
 
-# Singleton database instance for controller
-_db = Database()
 
+def invalidate_voters_cache() -> None:
+    """Drop cached voter stats, and the dashboard reads that count voters, after a write."""
+    voter_stats.cache_clear()
+    invalidate_elections_cache()
 
-def list_voters_with_status() -> list[dict]:
-    """Return all voters with their voting status."""
+
+def list_voters_with_status(limit: int | None = None, offset: int = 0) -> list[dict]:
+    """Return voters with their voting status.
+
+    `limit`/`offset` page the result in name order; by default every voter is
+    returned.
+    """
     conn = get_connection()
     if not conn:
         return []
-    cursor = conn.cursor(dictionary=True)
-    # Consider any vote across elections; show latest vote time if multiple
-    cursor.execute("""
-        SELECT u.*, vr_latest.voted_at
-        FROM users u
-        LEFT JOIN (
-            SELECT user_id, MAX(voted_at) AS voted_at
-            FROM voting_records
-            GROUP BY user_id
-        ) vr_latest ON vr_latest.user_id = u.user_id
-        WHERE u.role = 'student'
-        ORDER BY u.full_name
-    """)
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return rows
+    with closing(conn), conn.cursor(dictionary=True) as cursor:
+        # Consider any vote across elections; show latest vote time if multiple.
+        # Only the profile columns the voter list shows are read (never password_hash).
+        # The latest vote is looked up per listed student, a single backward seek on
+        # idx_vr_user_voted, instead of grouping every voting record up front
+        sql = """
+            SELECT u.user_id, u.username, u.full_name, u.student_id, u.email,
+                   u.role, u.grade_level, u.section, u.created_at,
+                   (SELECT MAX(vr.voted_at)
+                    FROM voting_records vr
+                    WHERE vr.user_id = u.user_id) AS voted_at
+            FROM users u
+            WHERE u.role = 'student'
+            ORDER BY u.full_name
+        """
+        params = ()
+        if limit is not None:
+            sql += " LIMIT %s OFFSET %s"
+            params = (int(limit), int(offset or 0))
+        cursor.execute(sql, params)
+        return cursor.fetchall()
 
 
 def create_voter(data: dict) -> tuple[bool, str]:
     """Create a new voter (student)."""
-    return _db.create_voter(
+    result = _db.create_voter(
         full_name=data.get("full_name"),
         email=data.get("email"),
         student_id=data.get("student_id"),
@@ -42,11 +56,22 @@ def create_voter(data: dict) -> tuple[bool, str]:
         grade_level=data.get("grade_level"),
         section=data.get("section"),
     )
+    if result[0]:
+        invalidate_voters_cache()
+    return result
+
+
+def register_user(full_name: str, email: str, student_id: str, password: str) -> tuple[bool, str]:
+    """Self-register a student account."""
+    result = _db.register_user(full_name, email, student_id, password)
+    if result[0]:
+        invalidate_voters_cache()
+    return result
 
 
 def update_voter(user_id: int, data: dict) -> tuple[bool, str]:
     """Update voter information."""
-    return _db.update_voter(
+    result = _db.update_voter(
         user_id=user_id,
         full_name=data.get("full_name"),
         email=data.get("email"),
@@ -54,13 +79,20 @@ def update_voter(user_id: int, data: dict) -> tuple[bool, str]:
         grade_level=data.get("grade_level"),
         section=data.get("section"),
     )
+    if result[0]:
+        invalidate_voters_cache()
+    return result
 
 
 def delete_voter(user_id: int) -> tuple[bool, str]:
     """Delete a voter."""
-    return _db.delete_voter(user_id)
+    result = _db.delete_voter(user_id)
+    if result[0]:
+        invalidate_voters_cache()
+    return result
 
 
+@ttl_cache(ttl=3)
 def voter_stats() -> dict:
     """Get voter statistics."""
     return _db.get_voter_stats()
@@ -99,4 +131,15 @@ def has_user_voted(user_id: int, election_id: int) -> bool:
 
 def cast_vote(user_id: int, election_id: int, candidate_id: int) -> tuple[bool, str]:
     """Cast a vote."""
-    return _db.cast_vote(user_id, election_id, candidate_id)
+    result = _db.cast_vote(user_id, election_id, candidate_id)
+    if result[0]:
+        invalidate_voters_cache()
+    return result
+
+
+def cast_ballot_votes(user_id: int, election_id: int, votes: list[dict]) -> tuple[bool, str]:
+    """Cast a full ballot (one vote per position)."""
+    result = _db.cast_ballot_votes(user_id, election_id, votes)
+    if result[0]:
+        invalidate_voters_cache()
+    return result
@@ -5,13 +5,19 @@ Moved out of Models to keep ORM models isolated. Controllers should use this cla
 for all database operations.
 """
 import hashlib
+import hmac
+import time
+from contextlib import contextmanager
+from datetime import date
 
 try:
     import bcrypt as py_bcrypt
 except Exception:  # pragma: no cover
     py_bcrypt = None
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, case
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload, load_only, raiseload
+from config import BCRYPT_ROUNDS
 from Models.base import get_session, init_db, get_connection
 from Models.model_user import User
 from Models.model_election import Election
@@ -21,63 +27,42 @@ from Models.model_voting_record import VotingRecord
 from Models.model_position import Position
 from Models.model_audit_log import AuditLog
 
+# Columns User.to_dict() reads; list endpoints load only these (never password_hash)
+_USER_DICT_COLS = (
+    User.user_id, User.username, User.full_name, User.student_id, User.email,
+    User.role, User.grade_level, User.section, User.created_at,
+)
+
 
 class Database:
-    def _normalize_date(self, value):
-        if value is None:
-            return None
-        try:
-            from datetime import date, datetime
-            if isinstance(value, datetime):
-                return value.date()
-            if isinstance(value, date):
-                return value
-            if isinstance(value, str):
-                value = value.strip()
-                if not value:
-                    return None
-                return datetime.strptime(value[:10], "%Y-%m-%d").date()
-        except Exception:
-            return None
-        return None
-
-    def _compute_status_from_dates(self, start_date, end_date, today=None):
-        from datetime import date
-
-        today = today or date.today()
-        start = self._normalize_date(start_date)
-        end = self._normalize_date(end_date)
-
-        if start and today < start:
-            return "upcoming"
-        if end and today > end:
-            return "finalized"
-        if start and end and start <= today <= end:
-            return "active"
-        if start and not end and today >= start:
-            return "active"
-        if end and not start:
-            return "active" if today <= end else "finalized"
-        return None
-
-    def _sync_election_statuses(self, session, elections):
-        from datetime import date
+    # Date-driven status sync runs at most once per this many seconds per process
+    _STATUS_SYNC_INTERVAL = 30.0
+
+    def _sync_all_elections(self, session):
+        """Move unlocked elections to the status their dates imply, in one UPDATE.
 
+        Elections with no dates are left alone. Reads call this before querying
+        elections, so the throttle keeps it to one statement per interval.
+        """
+        now = time.monotonic()
+        if now - self._last_status_sync < self._STATUS_SYNC_INTERVAL:
+            return
         today = date.today()
-        changed = False
-        for e in elections:
-            if bool(getattr(e, "status_locked", False)):
-                continue
-            new_status = self._compute_status_from_dates(e.start_date, e.end_date, today)
-            if new_status and e.status != new_status:
-                e.status = new_status
-                changed = True
+        # Mirrors the old per-row rules: not started -> upcoming, past end ->
+        # finalized, otherwise (in range, or open-ended on one side) -> active
+        expected = case(
+            (Election.start_date > today, 'upcoming'),
+            (Election.end_date < today, 'finalized'),
+            else_='active',
+        )
+        changed = session.query(Election).filter(
+            func.coalesce(Election.status_locked, 0) == 0,
+            or_(Election.start_date.isnot(None), Election.end_date.isnot(None)),
+            or_(Election.status.is_(None), Election.status != expected),
+        ).update({Election.status: expected}, synchronize_session=False)
         if changed:
             session.commit()
-
-    def _sync_all_elections(self, session):
-        elections = session.query(Election).all()
-        self._sync_election_statuses(session, elections)
+        self._last_status_sync = now
     """
     Service layer that provides data access operations using SQLAlchemy ORM.
     Controllers should use this class for all database operations.
@@ -86,6 +71,20 @@ class Database:
     def __init__(self):
         # Initialize database schema on first Database instance
         init_db()
+        self._last_status_sync = 0.0
+
+    @staticmethod
+    @contextmanager
+    def _session():
+        """Yield a fresh session that is rolled back on error and always closed."""
+        session = get_session()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
     def _log_audit(self, session, action: str, details: str | None = None, user_id: int | None = None):
         """Insert an audit log record using an existing session."""
@@ -104,9 +103,11 @@ class Database:
 
     def get_audit_logs(self, limit: int | None = 10) -> list[dict]:
         """Get recent audit logs for admin visibility."""
-        session = get_session()
-        try:
-            query = session.query(AuditLog).outerjoin(User, User.user_id == AuditLog.user_id).order_by(
+        with self._session() as session:
+            # Populate log.user from the join itself instead of a lazy SELECT per row
+            query = session.query(AuditLog).outerjoin(User, User.user_id == AuditLog.user_id).options(
+                contains_eager(AuditLog.user)
+            ).order_by(
                 AuditLog.created_at.desc()
             )
             if limit is not None:
@@ -115,7 +116,11 @@ class Database:
 
             # If no audit logs yet, fallback to voting records so the panel isn't empty.
             if not logs:
-                vr_query = session.query(VotingRecord).join(User).join(Election).order_by(
+                vr_query = session.query(VotingRecord).join(User).join(Election).options(
+                    contains_eager(VotingRecord.user),
+                    contains_eager(VotingRecord.election),
+                    joinedload(VotingRecord.candidate),
+                ).order_by(
                     VotingRecord.voted_at.desc()
                 )
                 if limit is not None:
@@ -162,15 +167,23 @@ class Database:
                     "user_name": user_name or "System",
                 })
             return result
-        finally:
-            session.close()
     
     # === User methods ===
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash password using SHA-256."""
+        """Hash password using bcrypt (BCRYPT_ROUNDS); SHA-256 only if bcrypt is missing."""
+        if py_bcrypt is not None:
+            return py_bcrypt.hashpw(
+                password.encode("utf-8"),
+                py_bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
+            ).decode("utf-8")
         return hashlib.sha256(password.encode()).hexdigest()
 
+    @staticmethod
+    def _needs_rehash(stored_hash: str | None) -> bool:
+        """True for legacy SHA-256 hashes that can be upgraded to bcrypt."""
+        return py_bcrypt is not None and not (stored_hash or "").strip().startswith("$2")
+
     @staticmethod
     def _verify_password(password: str, stored_hash: str | None) -> bool:
         """Verify a plaintext password against either SHA-256 hex or bcrypt hashes."""
@@ -196,213 +209,239 @@ class Database:
             except Exception:
                 return False
 
-        return Database.hash_password(password) == stored
+        # Legacy rows hold an unsalted SHA-256 hex digest; compare in constant time
+        # so a mismatch does not leak how many leading characters matched
+        return hmac.compare_digest(
+            hashlib.sha256(password.encode()).hexdigest().encode("ascii"),
+            stored.encode("utf-8"),
+        )
+
+    # Hash checked when no account matches, so "unknown user" costs the same as
+    # "wrong password"; built on first use to keep bcrypt work off import time
+    _dummy_hash: str | None = None
+
+    @classmethod
+    def _verify_dummy_password(cls, password: str) -> None:
+        """Run a full password check against a throwaway hash and discard the result."""
+        if cls._dummy_hash is None:
+            cls._dummy_hash = cls.hash_password("eduvote-dummy-password")
+        cls._verify_password(password, cls._dummy_hash)
     
+    @staticmethod
+    def _user_exists(session, *criteria) -> bool:
+        """Check for a matching user with a bare EXISTS, without loading the row."""
+        return bool(session.query(session.query(User.user_id).filter(*criteria).exists()).scalar())
+
     def username_exists(self, username: str) -> bool:
         """Check if username already exists."""
-        session = get_session()
-        try:
-            exists = session.query(User).filter(User.username == username.strip()).first() is not None
-            return exists
-        finally:
-            session.close()
+        with self._session() as session:
+            return self._user_exists(session, User.username == username.strip())
     
     def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
-        session = get_session()
-        try:
-            exists = session.query(User).filter(User.email == email.strip().lower()).first() is not None
-            return exists
-        finally:
-            session.close()
+        with self._session() as session:
+            return self._user_exists(session, User.email == email.strip().lower())
     
     def student_id_exists(self, student_id: str) -> bool:
         """Check if student ID already exists."""
-        session = get_session()
-        try:
-            exists = session.query(User).filter(User.student_id == student_id.strip()).first() is not None
-            return exists
-        finally:
-            session.close()
+        with self._session() as session:
+            return self._user_exists(session, User.student_id == student_id.strip())
     
     def register_user(self, full_name: str, email: str, student_id: str, password: str,
                       grade_level=None, section=None) -> tuple[bool, str]:
         """Register a new user."""
-        session = get_session()
-        try:
-            # Check for existing email or student_id
-            if session.query(User).filter(User.email == email.strip().lower()).first():
-                return False, "Email already registered."
-            if session.query(User).filter(User.student_id == student_id.strip()).first():
-                return False, "Student ID already registered."
+        with self._session() as session:
+            try:
+                # Check for existing email or student_id in one round-trip; both columns
+                # are unique-indexed, so this reads at most two rows
+                em = email.strip().lower()
+                sid = student_id.strip()
+                email_taken, sid_taken = session.query(
+                    func.max(case((User.email == em, 1), else_=0)),
+                    func.max(case((User.student_id == sid, 1), else_=0)),
+                ).filter(or_(User.email == em, User.student_id == sid)).one()
+                if email_taken:
+                    return False, "Email already registered."
+                if sid_taken:
+                    return False, "Student ID already registered."
             
-            # Create username from student_id
-            username = student_id.strip()
+                # Create username from student_id
+                username = student_id.strip()
             
-            user = User(
-                username=username,
-                password_hash=self.hash_password(password),
-                full_name=full_name.strip(),
-                student_id=student_id.strip(),
-                email=email.strip().lower(),
-                role='student',
-                grade_level=grade_level,
-                section=section
-            )
-            session.add(user)
-            session.flush()
-            self._log_audit(
-                session,
-                "Voter registered",
-                f"{user.full_name} ({user.student_id}) registered",
-                user.user_id,
-            )
-            session.commit()
-            return True, "Registration successful!"
-        except IntegrityError as e:
-            session.rollback()
-            return False, f"Registration failed: {str(e)}"
-        except Exception as e:
-            session.rollback()
-            return False, f"Registration failed: {str(e)}"
-        finally:
-            session.close()
+                user = User(
+                    username=username,
+                    password_hash=self.hash_password(password),
+                    full_name=full_name.strip(),
+                    student_id=student_id.strip(),
+                    email=email.strip().lower(),
+                    role='student',
+                    grade_level=grade_level,
+                    section=section
+                )
+                session.add(user)
+                session.flush()
+                self._log_audit(
+                    session,
+                    "Voter registered",
+                    f"{user.full_name} ({user.student_id}) registered",
+                    user.user_id,
+                )
+                session.commit()
+                return True, "Registration successful!"
+            except IntegrityError as e:
+                session.rollback()
+                return False, f"Registration failed: {str(e)}"
+            except Exception as e:
+                session.rollback()
+                return False, f"Registration failed: {str(e)}"
     
     def authenticate_user(self, username: str, student_id: str, password: str) -> tuple[bool, dict | None]:
         """Authenticate a user by username/student_id and password."""
-        session = get_session()
-        try:
-            user = session.query(User).filter(
-                or_(
-                    User.username == username.strip(),
-                    User.student_id == student_id.strip(),
-                )
-            ).first()
+        username = (username or "").strip()
+        student_id = (student_id or "").strip()
+        # Only match on identifiers the user actually entered; each side is an indexed lookup.
+        criteria = []
+        if username:
+            criteria.append(User.username == username)
+        if student_id:
+            criteria.append(User.student_id == student_id)
+        if not criteria:
+            return False, None
 
-            if user and self._verify_password(password, user.password_hash):
+        with self._session() as session:
+            user = session.query(User).filter(or_(*criteria)).limit(1).first()
+            if user is None:
+                self._verify_dummy_password(password or "")
+                return False, None
+
+            if self._verify_password(password, user.password_hash):
+                # Read the row out before a commit expires it (avoids a reload SELECT)
+                user_data = user.to_dict()
+                # Legacy SHA-256 rows are upgraded to bcrypt on their first good login;
+                # only that upgrade is committed here
+                if self._needs_rehash(user.password_hash):
+                    user.password_hash = self.hash_password(password)
+                    try:
+                        session.commit()
+                    except Exception:
+                        # A failed rehash must not block the login itself
+                        session.rollback()
                 self._log_audit(
                     session,
                     "Login",
-                    f"{user.full_name} logged in",
-                    user.user_id,
+                    f"{user_data['full_name']} logged in",
+                    user_data['user_id'],
                 )
-                return True, user.to_dict()
+                return True, user_data
             return False, None
-        finally:
-            session.close()
 
     def reset_password(self, student_id: str, email: str, new_password: str) -> tuple[bool, str]:
         """Reset a user's password by verifying student_id + email."""
-        session = get_session()
-        try:
-            sid = (student_id or "").strip()
-            em = (email or "").strip().lower()
-            if not sid or not em or not new_password:
-                return False, "Missing required information."
+        with self._session() as session:
+            try:
+                sid = (student_id or "").strip()
+                em = (email or "").strip().lower()
+                if not sid or not em or not new_password:
+                    return False, "Missing required information."
 
-            user = session.query(User).filter(
-                and_(User.student_id == sid, func.lower(User.email) == em)
-            ).first()
-            if not user:
-                return False, "No account matches that Student ID and email."
-
-            user.password_hash = self.hash_password(new_password)
-            self._log_audit(
-                session,
-                "Password reset",
-                f"Password reset for {user.full_name} ({user.student_id})",
-                user.user_id,
-            )
-            session.commit()
-            return True, "Password reset successfully. You can now log in."
-        except Exception as e:
-            session.rollback()
-            return False, f"Password reset failed: {str(e)}"
-        finally:
-            session.close()
+                user = session.query(User).filter(
+                    and_(User.student_id == sid, func.lower(User.email) == em)
+                ).first()
+                if not user:
+                    return False, "No account matches that Student ID and email."
+
+                user.password_hash = self.hash_password(new_password)
+                self._log_audit(
+                    session,
+                    "Password reset",
+                    f"Password reset for {user.full_name} ({user.student_id})",
+                    user.user_id,
+                )
+                session.commit()
+                return True, "Password reset successfully. You can now log in."
+            except Exception as e:
+                session.rollback()
+                return False, f"Password reset failed: {str(e)}"
     
     def get_user_by_id(self, user_id: int) -> dict | None:
         """Get user by ID."""
-        session = get_session()
-        try:
+        with self._session() as session:
             user = session.query(User).filter(User.user_id == user_id).first()
             return user.to_dict() if user else None
-        finally:
-            session.close()
     
     def update_user_profile(self, user_id: int, full_name: str, email: str, student_id: str,
                             new_password: str | None = None) -> tuple[bool, str]:
         """Update user profile."""
-        session = get_session()
-        try:
-            user = session.query(User).filter(User.user_id == user_id).first()
-            if not user:
-                return False, "User not found."
+        with self._session() as session:
+            try:
+                user = session.query(User).filter(User.user_id == user_id).first()
+                if not user:
+                    return False, "User not found."
             
-            # Check for duplicate email/student_id
-            if email.strip().lower() != user.email:
-                if session.query(User).filter(User.email == email.strip().lower()).first():
-                    return False, "Email already in use."
+                # Check for duplicate email/student_id
+                if email.strip().lower() != user.email:
+                    if self._user_exists(session, User.email == email.strip().lower()):
+                        return False, "Email already in use."
             
-            if student_id.strip() != user.student_id:
-                if session.query(User).filter(User.student_id == student_id.strip()).first():
-                    return False, "Student ID already in use."
+                if student_id.strip() != user.student_id:
+                    if self._user_exists(session, User.student_id == student_id.strip()):
+                        return False, "Student ID already in use."
             
-            user.full_name = full_name.strip()
-            user.email = email.strip().lower()
-            user.student_id = student_id.strip()
-            user.username = student_id.strip()  # Keep username synced
-
-            self._log_audit(
-                session,
-                "Profile updated",
-                f"Profile updated for {user.full_name} ({user.student_id})",
-                user.user_id,
-            )
+                user.full_name = full_name.strip()
+                user.email = email.strip().lower()
+                user.student_id = student_id.strip()
+                user.username = student_id.strip()  # Keep username synced
+
+                self._log_audit(
+                    session,
+                    "Profile updated",
+                    f"Profile updated for {user.full_name} ({user.student_id})",
+                    user.user_id,
+                )
             
-            if new_password:
-                user.password_hash = self.hash_password(new_password)
+                if new_password:
+                    user.password_hash = self.hash_password(new_password)
             
-            session.commit()
-            return True, "Profile updated successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Update failed: {str(e)}"
-        finally:
-            session.close()
+                session.commit()
+                return True, "Profile updated successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Update failed: {str(e)}"
     
     def list_student_users(self) -> list[dict]:
         """Get all students."""
-        session = get_session()
-        try:
-            users = session.query(User).filter(User.role == 'student').all()
+        with self._session() as session:
+            users = session.query(User).options(load_only(*_USER_DICT_COLS)).filter(
+                User.role == 'student'
+            ).all()
             return [u.to_dict() for u in users]
-        finally:
-            session.close()
     
     def get_all_voters(self) -> list[dict]:
         """Get all voters with voting stats."""
-        session = get_session()
-        try:
-            users = session.query(User).filter(User.role == 'student').all()
+        with self._session() as session:
+            # One grouped count instead of loading every student's votes collection;
+            # raiseload makes any reintroduced u.votes access fail loudly
+            counts = dict(
+                session.query(VotingRecord.user_id, func.count(VotingRecord.record_id))
+                .group_by(VotingRecord.user_id)
+                .all()
+            )
+            users = session.query(User).options(
+                load_only(*_USER_DICT_COLS), raiseload(User.votes)
+            ).filter(User.role == 'student').all()
             result = []
             for u in users:
                 user_dict = u.to_dict()
-                user_dict['votes_cast'] = len(u.votes)
+                user_dict['votes_cast'] = counts.get(u.user_id, 0)
                 result.append(user_dict)
             return result
-        finally:
-            session.close()
     
     def get_voter_stats(self) -> dict:
         """Get voter statistics."""
-        session = get_session()
-        try:
+        with self._session() as session:
             total = session.query(func.count(User.user_id)).filter(User.role == 'student').scalar() or 0
             active = session.query(func.count(func.distinct(VotingRecord.user_id))).scalar() or 0
             return {'total_voters': total, 'active_voters': active}
-        finally:
-            session.close()
     
     def create_voter(self, full_name: str, email: str, student_id: str, password: str,
                      grade_level=None, section=None) -> tuple[bool, str]:
@@ -412,199 +451,219 @@ class Database:
     def update_voter(self, user_id: int, full_name: str, email: str, student_id: str,
                      grade_level=None, section=None) -> tuple[bool, str]:
         """Update voter information."""
-        session = get_session()
-        try:
-            user = session.query(User).filter(User.user_id == user_id).first()
-            if not user:
-                return False, "User not found."
+        with self._session() as session:
+            try:
+                user = session.query(User).filter(User.user_id == user_id).first()
+                if not user:
+                    return False, "User not found."
             
-            user.full_name = full_name.strip()
-            user.email = email.strip().lower()
-            user.student_id = student_id.strip()
-            user.username = student_id.strip()
-            user.grade_level = grade_level
-            user.section = section
-
-            self._log_audit(
-                session,
-                "Voter updated",
-                f"Voter updated: {user.full_name} ({user.student_id})",
-                user.user_id,
-            )
+                user.full_name = full_name.strip()
+                user.email = email.strip().lower()
+                user.student_id = student_id.strip()
+                user.username = student_id.strip()
+                user.grade_level = grade_level
+                user.section = section
+
+                self._log_audit(
+                    session,
+                    "Voter updated",
+                    f"Voter updated: {user.full_name} ({user.student_id})",
+                    user.user_id,
+                )
             
-            session.commit()
-            return True, "Voter updated successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Update failed: {str(e)}"
-        finally:
-            session.close()
+                session.commit()
+                return True, "Voter updated successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Update failed: {str(e)}"
     
     def delete_voter(self, user_id: int) -> tuple[bool, str]:
         """Delete a voter."""
-        session = get_session()
-        try:
-            user = session.query(User).filter(User.user_id == user_id).first()
-            if not user:
-                return False, "User not found."
-            self._log_audit(
-                session,
-                "Voter deleted",
-                f"Voter deleted: {user.full_name} ({user.student_id})",
-                user.user_id,
-            )
-            session.delete(user)
-            session.commit()
-            return True, "Voter deleted successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Delete failed: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                user = session.query(User).filter(User.user_id == user_id).first()
+                if not user:
+                    return False, "User not found."
+                self._log_audit(
+                    session,
+                    "Voter deleted",
+                    f"Voter deleted: {user.full_name} ({user.student_id})",
+                    user.user_id,
+                )
+                session.delete(user)
+                session.commit()
+                return True, "Voter deleted successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Delete failed: {str(e)}"
     
     # === Election methods ===
     def get_active_election(self) -> dict | None:
         """Get the currently active election."""
-        session = get_session()
-        try:
-            elections = session.query(Election).all()
-            self._sync_election_statuses(session, elections)
+        with self._session() as session:
+            self._sync_all_elections(session)
             election = session.query(Election).filter(Election.status == 'active').first()
             return election.to_dict() if election else None
-        finally:
-            session.close()
     
     def get_election_by_id(self, election_id: int) -> dict | None:
         """Get election by ID."""
-        session = get_session()
-        try:
+        with self._session() as session:
+            self._sync_all_elections(session)
             election = session.query(Election).filter(Election.election_id == election_id).first()
-            if election:
-                self._sync_election_statuses(session, [election])
             return election.to_dict() if election else None
-        finally:
-            session.close()
     
     def get_user_allowed_elections(self, user_id: int) -> list[dict]:
         """Get elections the user is allowed to participate in."""
-        session = get_session()
-        try:
-            user = session.query(User).filter(User.user_id == user_id).first()
+        with self._session() as session:
+            # Eligibility only looks at grade and section
+            user = session.query(User).options(
+                load_only(User.user_id, User.grade_level, User.section)
+            ).filter(User.user_id == user_id).first()
             if not user:
                 return []
 
             # Include all statuses so the student dashboard can show
             # upcoming/active/finalized elections in the tabs.
+            self._sync_all_elections(session)
             elections = session.query(Election).order_by(Election.start_date.desc()).all()
-            self._sync_election_statuses(session, elections)
             allowed = []
             for e in elections:
                 if e.is_user_eligible(user):
                     allowed.append(e.to_dict())
             return allowed
-        finally:
-            session.close()
     
-    def get_all_elections(self) -> list[dict]:
-        """Get all elections."""
-        session = get_session()
-        try:
-            elections = session.query(Election).order_by(Election.created_at.desc()).all()
-            self._sync_election_statuses(session, elections)
+    def get_all_elections(self, status_in: tuple[str, ...] | None = None) -> list[dict]:
+        """Get all elections, optionally only those whose status is in `status_in`."""
+        with self._session() as session:
+            # Sync first so the status filter sees date-corrected statuses
+            self._sync_all_elections(session)
+            query = session.query(Election)
+            if status_in:
+                wanted = tuple(s.lower() for s in status_in)
+                query = query.filter(Election.status.in_(wanted))
+            elections = query.order_by(Election.created_at.desc()).all()
             return [e.to_dict() for e in elections]
-        finally:
-            session.close()
     
     def create_election(self, title: str, description: str, start_date: str, end_date: str,
                         status: str = 'upcoming', allowed_grade=None, allowed_section='ALL') -> tuple[bool, str]:
         """Create a new election."""
-        session = get_session()
-        try:
-            election = Election(
-                title=title.strip(),
-                description=description,
-                start_date=start_date,
-                end_date=end_date,
-                status=status,
-                allowed_grade=allowed_grade,
-                allowed_section=allowed_section
-            )
-            session.add(election)
-            self._log_audit(
-                session,
-                "Election created",
-                f"Election created: {election.title}",
-                None,
-            )
-            session.commit()
-            return True, "Election created successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to create election: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                election = Election(
+                    title=title.strip(),
+                    description=description,
+                    start_date=start_date,
+                    end_date=end_date,
+                    status=status,
+                    allowed_grade=allowed_grade,
+                    allowed_section=allowed_section
+                )
+                session.add(election)
+                self._log_audit(
+                    session,
+                    "Election created",
+                    f"Election created: {election.title}",
+                    None,
+                )
+                session.commit()
+                return True, "Election created successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to create election: {str(e)}"
     
     def update_election(self, election_id: int, title: str, description: str, start_date: str,
                         end_date: str, status: str, allowed_grade=None, allowed_section='ALL',
                         status_locked: bool | None = None) -> tuple[bool, str]:
         """Update an election."""
-        session = get_session()
-        try:
-            election = session.query(Election).filter(Election.election_id == election_id).first()
-            if not election:
-                return False, "Election not found."
+        with self._session() as session:
+            try:
+                election = session.query(Election).filter(Election.election_id == election_id).first()
+                if not election:
+                    return False, "Election not found."
             
-            election.title = title.strip()
-            election.description = description
-            election.start_date = start_date
-            election.end_date = end_date
-            election.status = status
-            if status_locked is not None:
-                election.status_locked = bool(status_locked)
-            election.allowed_grade = allowed_grade
-            election.allowed_section = allowed_section
-
-            self._log_audit(
-                session,
-                "Election updated",
-                f"Election updated: {election.title} (status: {election.status})",
-                None,
-            )
+                election.title = title.strip()
+                election.description = description
+                election.start_date = start_date
+                election.end_date = end_date
+                election.status = status
+                if status_locked is not None:
+                    election.status_locked = bool(status_locked)
+                election.allowed_grade = allowed_grade
+                election.allowed_section = allowed_section
+
+                self._log_audit(
+                    session,
+                    "Election updated",
+                    f"Election updated: {election.title} (status: {election.status})",
+                    None,
+                )
             
-            session.commit()
-            return True, "Election updated successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to update election: {str(e)}"
-        finally:
-            session.close()
+                session.commit()
+                return True, "Election updated successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to update election: {str(e)}"
+    
+    def get_election_schedule(self, election_id: int) -> dict | None:
+        """Get only an election's title and dates (for status validation)."""
+        with self._session() as session:
+            row = session.query(Election.title, Election.start_date, Election.end_date).filter(
+                Election.election_id == election_id
+            ).first()
+            if not row:
+                return None
+            return {"title": row.title, "start_date": row.start_date, "end_date": row.end_date}
+
+    def update_election_status(self, election_id: int, status: str, status_locked: bool | None = None,
+                               title: str | None = None) -> tuple[bool, str]:
+        """Update only an election's status (and lock flag) with a single UPDATE."""
+        with self._session() as session:
+            try:
+                values = {Election.status: status}
+                if status_locked is not None:
+                    values[Election.status_locked] = bool(status_locked)
+                updated = session.query(Election).filter(
+                    Election.election_id == election_id
+                ).update(values, synchronize_session=False)
+                if not updated:
+                    session.rollback()
+                    return False, "Election not found."
+
+                self._log_audit(
+                    session,
+                    "Election updated",
+                    f"Election updated: {title or f'id {election_id}'} (status: {status})",
+                    None,
+                )
+                session.commit()
+                return True, "Election updated successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to update election: {str(e)}"
     
     def delete_election(self, election_id: int) -> tuple[bool, str]:
         """Delete an election."""
-        session = get_session()
-        try:
-            election = session.query(Election).filter(Election.election_id == election_id).first()
-            if not election:
-                return False, "Election not found."
-            self._log_audit(
-                session,
-                "Election deleted",
-                f"Election deleted: {election.title}",
-                None,
-            )
-            session.delete(election)
-            session.commit()
-            return True, "Election deleted successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to delete election: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                election = session.query(Election).filter(Election.election_id == election_id).first()
+                if not election:
+                    return False, "Election not found."
+                self._log_audit(
+                    session,
+                    "Election deleted",
+                    f"Election deleted: {election.title}",
+                    None,
+                )
+                session.delete(election)
+                session.commit()
+                return True, "Election deleted successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to delete election: {str(e)}"
     
     def get_election_results(self, election_id: int = None) -> dict:
         """Get election results with candidate vote counts."""
-        session = get_session()
-        try:
+        with self._session() as session:
             self._sync_all_elections(session)
             if election_id:
                 election = session.query(Election).filter(Election.election_id == election_id).first()
@@ -616,24 +675,26 @@ class Database:
             if not election:
                 return {"election": None, "candidates": [], "total_votes": 0}
             
+            # Stream candidates in batches and total votes in the same pass
             candidates = session.query(Candidate).filter(
                 Candidate.election_id == election.election_id
-            ).order_by(Candidate.vote_count.desc()).all()
-            
-            total_votes = sum(c.vote_count for c in candidates)
+            ).order_by(Candidate.vote_count.desc()).yield_per(256)
+
+            candidate_dicts = []
+            total_votes = 0
+            for c in candidates:
+                candidate_dicts.append(c.to_dict())
+                total_votes += c.vote_count or 0
             
             return {
                 "election": election.to_dict(),
-                "candidates": [c.to_dict() for c in candidates],
+                "candidates": candidate_dicts,
                 "total_votes": total_votes
             }
-        finally:
-            session.close()
     
     def get_admin_stats(self) -> dict:
         """Get admin dashboard statistics."""
-        session = get_session()
-        try:
+        with self._session() as session:
             self._sync_all_elections(session)
             total_voters = session.query(func.count(User.user_id)).filter(User.role == 'student').scalar() or 0
             votes_cast = session.query(func.count(VotingRecord.record_id)).scalar() or 0
@@ -652,8 +713,6 @@ class Database:
                 "participation_rate": participation_rate,
                 "active_elections": active_elections
             }
-        finally:
-            session.close()
     
     def get_recent_activity(self, limit: int | None = 5) -> list[dict]:
         """Get recent audit activity (fallback for dashboards)."""
@@ -667,8 +726,7 @@ class Database:
         - position_turnout: participation count per position in a ballot election
         - grade_section_turnout: turnout percentage per grade or section (based on election restrictions)
         """
-        session = get_session()
-        try:
+        with self._session() as session:
             self._sync_all_elections(session)
             chart_mode = (mode or "results").strip().lower()
 
@@ -691,7 +749,9 @@ class Database:
                 return {"title": "Dashboard", "data": []}
 
             if chart_mode == "position_turnout":
-                positions = session.query(Position).filter(
+                positions = session.query(Position).options(
+                    load_only(Position.position_id, Position.title)
+                ).filter(
                     Position.election_id == election.election_id
                 ).order_by(Position.display_order).all()
 
@@ -730,64 +790,41 @@ class Database:
                 if allowed_section and allowed_section.upper() != "ALL":
                     breakdown = "section"
 
-                if breakdown == "section":
-                    totals = dict(
-                        session.query(User.section, func.count(User.user_id))
-                        .filter(User.role == 'student', *user_filters)
-                        .group_by(User.section)
-                        .all()
-                    )
+                group_col = User.section if breakdown == "section" else User.grade_level
 
-                    voters = dict(
-                        session.query(User.section, func.count(func.distinct(VotingRecord.user_id)))
-                        .join(VotingRecord, VotingRecord.user_id == User.user_id)
-                        .filter(
-                            VotingRecord.election_id == election.election_id,
-                            User.role == 'student',
-                            *user_filters
-                        )
-                        .group_by(User.section)
-                        .all()
+                # One pass returns each group's student total and how many of them voted.
+                # The election filter sits in the ON clause so students without a record
+                # still count towards the total; DISTINCT undoes the multi-vote fan-out.
+                rows = (
+                    session.query(
+                        group_col,
+                        func.count(func.distinct(User.user_id)),
+                        func.count(func.distinct(VotingRecord.user_id)),
                     )
-
-                    data = []
-                    for section, total in totals.items():
-                        total_int = int(total or 0)
-                        voted_int = int(voters.get(section, 0) or 0)
-                        pct = int(round((voted_int / total_int) * 100)) if total_int > 0 else 0
-                        label = (section or "Unknown").strip() or "Unknown"
-                        data.append((label, pct))
-
-                    data.sort(key=lambda x: x[0].lower())
-                    return {"title": f"Turnout by Section (%): {election.title}", "data": data}
-
-                totals = dict(
-                    session.query(User.grade_level, func.count(User.user_id))
-                    .filter(User.role == 'student', *user_filters)
-                    .group_by(User.grade_level)
-                    .all()
-                )
-
-                voters = dict(
-                    session.query(User.grade_level, func.count(func.distinct(VotingRecord.user_id)))
-                    .join(VotingRecord, VotingRecord.user_id == User.user_id)
-                    .filter(
+                    .outerjoin(VotingRecord, and_(
+                        VotingRecord.user_id == User.user_id,
                         VotingRecord.election_id == election.election_id,
-                        User.role == 'student',
-                        *user_filters
-                    )
-                    .group_by(User.grade_level)
+                    ))
+                    .filter(User.role == 'student', *user_filters)
+                    .group_by(group_col)
                     .all()
                 )
 
                 data = []
-                for grade, total in totals.items():
+                for group, total, voted in rows:
                     total_int = int(total or 0)
-                    voted_int = int(voters.get(grade, 0) or 0)
+                    voted_int = int(voted or 0)
                     pct = int(round((voted_int / total_int) * 100)) if total_int > 0 else 0
-                    label = f"Grade {grade}" if grade is not None else "Unknown"
+                    if breakdown == "section":
+                        label = (group or "Unknown").strip() or "Unknown"
+                    else:
+                        label = f"Grade {group}" if group is not None else "Unknown"
                     data.append((label, pct))
 
+                if breakdown == "section":
+                    data.sort(key=lambda x: x[0].lower())
+                    return {"title": f"Turnout by Section (%): {election.title}", "data": data}
+
                 data.sort(key=lambda x: ("999" if x[0] == "Unknown" else x[0]))
                 return {"title": f"Turnout by Grade (%): {election.title}", "data": data}
 
@@ -859,16 +896,13 @@ class Database:
             fallback.sort(key=lambda x: x[1], reverse=True)
             fallback = fallback[:10]
             return {"title": f"Live Results (Top 10): {election.title}", "data": fallback}
-        finally:
-            session.close()
 
     def get_election_chart_data(self, election_id: int, mode: str = "results") -> dict:
         """Get chart data for a specific election.
 
         This mirrors `get_dashboard_chart_data` but allows the caller to choose the election.
         """
-        session = get_session()
-        try:
+        with self._session() as session:
             chart_mode = (mode or "results").strip().lower()
             election = session.query(Election).filter(Election.election_id == election_id).first()
             if not election:
@@ -1037,158 +1071,136 @@ class Database:
             fallback.sort(key=lambda x: x[1], reverse=True)
             fallback = fallback[:10]
             return {"title": f"Live Results (Top 10): {election.title}", "data": fallback}
-        finally:
-            session.close()
     
     # === Candidate methods ===
     def get_candidates_for_election(self, election_id: int) -> list[dict]:
         """Get all candidates for a specific election."""
-        session = get_session()
-        try:
+        with self._session() as session:
             candidates = session.query(Candidate).filter(
                 Candidate.election_id == election_id
             ).order_by(Candidate.full_name).all()
             return [c.to_dict() for c in candidates]
-        finally:
-            session.close()
     
     def get_all_candidates(self) -> list[dict]:
         """Get all candidates with election info."""
-        session = get_session()
-        try:
-            candidates = session.query(Candidate).join(Election).all()
+        with self._session() as session:
+            # Fetch the election title in the same row and stream in batches
+            rows = session.query(Candidate, Election.title).join(Election).yield_per(256)
             result = []
-            for c in candidates:
+            for c, election_title in rows:
                 cand_dict = c.to_dict()
-                cand_dict['election_title'] = c.election.title
+                cand_dict['election_title'] = election_title
                 result.append(cand_dict)
             return result
-        finally:
-            session.close()
     
     def create_candidate(self, election_id: int, full_name: str, slogan: str,
                          photo_path: str = None) -> tuple[bool, str]:
         """Create a new candidate."""
-        session = get_session()
-        try:
-            candidate = Candidate(
-                election_id=election_id,
-                full_name=full_name.strip(),
-                slogan=slogan,
-                photo_path=photo_path,
-                vote_count=0
-            )
-            session.add(candidate)
-            self._log_audit(
-                session,
-                "Candidate created",
-                f"Candidate created: {candidate.full_name} (election_id: {election_id})",
-                None,
-            )
-            session.commit()
-            return True, "Candidate created successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to create candidate: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                candidate = Candidate(
+                    election_id=election_id,
+                    full_name=full_name.strip(),
+                    slogan=slogan,
+                    photo_path=photo_path,
+                    vote_count=0
+                )
+                session.add(candidate)
+                self._log_audit(
+                    session,
+                    "Candidate created",
+                    f"Candidate created: {candidate.full_name} (election_id: {election_id})",
+                    None,
+                )
+                session.commit()
+                return True, "Candidate created successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to create candidate: {str(e)}"
     
     def update_candidate(self, candidate_id: int, full_name: str, slogan: str,
                          photo_path: str = None, election_id: int = None) -> tuple[bool, str]:
         """Update a candidate."""
-        session = get_session()
-        try:
-            candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
-            if not candidate:
-                return False, "Candidate not found."
+        with self._session() as session:
+            try:
+                candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
+                if not candidate:
+                    return False, "Candidate not found."
             
-            candidate.full_name = full_name.strip()
-            candidate.slogan = slogan
-            if photo_path:
-                candidate.photo_path = photo_path
-            if election_id:
-                candidate.election_id = election_id
+                candidate.full_name = full_name.strip()
+                candidate.slogan = slogan
+                if photo_path:
+                    candidate.photo_path = photo_path
+                if election_id:
+                    candidate.election_id = election_id
 
-            self._log_audit(
-                session,
-                "Candidate updated",
-                f"Candidate updated: {candidate.full_name} (id: {candidate.candidate_id})",
-                None,
-            )
+                self._log_audit(
+                    session,
+                    "Candidate updated",
+                    f"Candidate updated: {candidate.full_name} (id: {candidate.candidate_id})",
+                    None,
+                )
             
-            session.commit()
-            return True, "Candidate updated successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to update candidate: {str(e)}"
-        finally:
-            session.close()
+                session.commit()
+                return True, "Candidate updated successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to update candidate: {str(e)}"
     
     def delete_candidate(self, candidate_id: int) -> tuple[bool, str]:
         """Delete a candidate."""
-        session = get_session()
-        try:
-            candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
-            if not candidate:
-                return False, "Candidate not found."
-            self._log_audit(
-                session,
-                "Candidate deleted",
-                f"Candidate deleted: {candidate.full_name} (id: {candidate.candidate_id})",
-                None,
-            )
-            session.delete(candidate)
-            session.commit()
-            return True, "Candidate deleted successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to delete candidate: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
+                if not candidate:
+                    return False, "Candidate not found."
+                self._log_audit(
+                    session,
+                    "Candidate deleted",
+                    f"Candidate deleted: {candidate.full_name} (id: {candidate.candidate_id})",
+                    None,
+                )
+                session.delete(candidate)
+                session.commit()
+                return True, "Candidate deleted successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to delete candidate: {str(e)}"
     
     # === Section methods ===
     def get_sections(self) -> list[dict]:
         """Get all sections."""
-        session = get_session()
-        try:
+        with self._session() as session:
             sections = session.query(Section).order_by(Section.grade_level, Section.section_name).all()
             return [s.to_dict() for s in sections]
-        finally:
-            session.close()
     
     def create_section(self, grade_level: int, section_name: str) -> tuple[bool, str]:
         """Create a new section."""
-        session = get_session()
-        try:
-            section = Section(grade_level=grade_level, section_name=section_name.strip())
-            session.add(section)
-            session.commit()
-            return True, "Section created successfully!"
-        except IntegrityError:
-            session.rollback()
-            return False, "Section already exists."
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to create section: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                section = Section(grade_level=grade_level, section_name=section_name.strip())
+                session.add(section)
+                session.commit()
+                return True, "Section created successfully!"
+            except IntegrityError:
+                session.rollback()
+                return False, "Section already exists."
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to create section: {str(e)}"
     
     # === Voting record methods ===
     def has_user_voted(self, user_id: int, election_id: int) -> bool:
         """Check if user has already voted in an election."""
-        session = get_session()
-        try:
+        with self._session() as session:
             record = session.query(VotingRecord).filter(
                 and_(VotingRecord.user_id == user_id, VotingRecord.election_id == election_id)
             ).first()
             return record is not None
-        finally:
-            session.close()
     
     def get_user_voting_history(self, user_id: int) -> list[dict]:
         """Get voting history for a user."""
-        session = get_session()
-        try:
+        with self._session() as session:
             records = session.query(VotingRecord).filter(
                 VotingRecord.user_id == user_id
             ).join(Election).order_by(VotingRecord.voted_at.desc()).all()
@@ -1208,195 +1220,237 @@ class Database:
                     'status': r.status
                 })
             return result
-        finally:
-            session.close()
     
     def cast_vote(self, user_id: int, election_id: int, candidate_id: int) -> tuple[bool, str]:
         """Cast a vote for a candidate (legacy single-vote method)."""
-        session = get_session()
-        try:
-            candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
-            if not candidate:
-                return False, "Candidate not found."
-
-            # Vote is tracked per position (preferred). If position is missing, fall back to election-level.
-            position_id = candidate.position_id
-            if position_id is not None:
-                existing = session.query(VotingRecord).filter(
-                    and_(
-                        VotingRecord.user_id == user_id,
-                        VotingRecord.election_id == election_id,
-                        VotingRecord.position_id == position_id,
-                    )
-                ).first()
-                if existing:
-                    return False, "You have already voted for this position in this election."
-            else:
-                existing = session.query(VotingRecord).filter(
-                    and_(VotingRecord.user_id == user_id, VotingRecord.election_id == election_id)
-                ).first()
-                if existing:
-                    return False, "You have already voted in this election."
+        with self._session() as session:
+            try:
+                candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
+                if not candidate:
+                    return False, "Candidate not found."
+
+                # Vote is tracked per position (preferred). If position is missing, fall back to election-level.
+                position_id = candidate.position_id
+                if position_id is not None:
+                    existing = session.query(VotingRecord).filter(
+                        and_(
+                            VotingRecord.user_id == user_id,
+                            VotingRecord.election_id == election_id,
+                            VotingRecord.position_id == position_id,
+                        )
+                    ).first()
+                    if existing:
+                        return False, "You have already voted for this position in this election."
+                else:
+                    existing = session.query(VotingRecord).filter(
+                        and_(VotingRecord.user_id == user_id, VotingRecord.election_id == election_id)
+                    ).first()
+                    if existing:
+                        return False, "You have already voted in this election."
             
-            # Create voting record
-            record = VotingRecord(
-                user_id=user_id,
-                election_id=election_id,
-                position_id=position_id,
-                candidate_id=candidate_id,
-                status='cast'
-            )
-            session.add(record)
+                # Create voting record
+                record = VotingRecord(
+                    user_id=user_id,
+                    election_id=election_id,
+                    position_id=position_id,
+                    candidate_id=candidate_id,
+                    status='cast'
+                )
+                session.add(record)
             
-            # Update candidate vote count
-            candidate.vote_count = (candidate.vote_count or 0) + 1
-
-            self._log_audit(
-                session,
-                "Vote cast",
-                f"Vote cast for {candidate.full_name} (election_id: {election_id})",
-                user_id,
-            )
+                # Update candidate vote count
+                candidate.vote_count = (candidate.vote_count or 0) + 1
+
+                self._log_audit(
+                    session,
+                    "Vote cast",
+                    f"Vote cast for {candidate.full_name} (election_id: {election_id})",
+                    user_id,
+                )
             
-            session.commit()
-            return True, "Vote cast successfully!"
-        except IntegrityError:
-            session.rollback()
-            # Most commonly triggered by the unique index on (user_id, election_id, position_id)
-            return False, "You have already voted for this position in this election."
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to cast vote: {str(e)}"
-        finally:
-            session.close()
+                session.commit()
+                return True, "Vote cast successfully!"
+            except IntegrityError:
+                session.rollback()
+                # Most commonly triggered by the unique index on (user_id, election_id, position_id)
+                return False, "You have already voted for this position in this election."
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to cast vote: {str(e)}"
     
     # === Position methods ===
     def get_positions_for_election(self, election_id: int) -> list[dict]:
         """Get all positions for an election, ordered by display_order."""
-        session = get_session()
-        try:
+        with self._session() as session:
             positions = session.query(Position).filter(
                 Position.election_id == election_id
             ).order_by(Position.display_order).all()
             return [p.to_dict() for p in positions]
-        finally:
-            session.close()
     
     def create_position(self, election_id: int, title: str, display_order: int = 0) -> tuple[bool, str, int | None]:
         """Create a new position for an election."""
-        session = get_session()
-        try:
-            position = Position(
-                election_id=election_id,
-                title=title.strip(),
-                display_order=display_order
-            )
-            session.add(position)
-            self._log_audit(
-                session,
-                "Position created",
-                f"Position created: {position.title} (election_id: {election_id})",
-                None,
-            )
-            session.commit()
-            position_id = position.position_id
-            return True, "Position created successfully!", position_id
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to create position: {str(e)}", None
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                position = Position(
+                    election_id=election_id,
+                    title=title.strip(),
+                    display_order=display_order
+                )
+                session.add(position)
+                self._log_audit(
+                    session,
+                    "Position created",
+                    f"Position created: {position.title} (election_id: {election_id})",
+                    None,
+                )
+                session.commit()
+                position_id = position.position_id
+                return True, "Position created successfully!", position_id
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to create position: {str(e)}", None
     
     def update_position(self, position_id: int, title: str, display_order: int = None) -> tuple[bool, str]:
         """Update a position."""
-        session = get_session()
-        try:
-            position = session.query(Position).filter(Position.position_id == position_id).first()
-            if not position:
-                return False, "Position not found."
-            position.title = title.strip()
-            if display_order is not None:
-                position.display_order = display_order
-            self._log_audit(
-                session,
-                "Position updated",
-                f"Position updated: {position.title} (id: {position.position_id})",
-                None,
-            )
-            session.commit()
-            return True, "Position updated successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to update position: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                position = session.query(Position).filter(Position.position_id == position_id).first()
+                if not position:
+                    return False, "Position not found."
+                position.title = title.strip()
+                if display_order is not None:
+                    position.display_order = display_order
+                self._log_audit(
+                    session,
+                    "Position updated",
+                    f"Position updated: {position.title} (id: {position.position_id})",
+                    None,
+                )
+                session.commit()
+                return True, "Position updated successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to update position: {str(e)}"
     
     def delete_position(self, position_id: int) -> tuple[bool, str]:
         """Delete a position."""
-        session = get_session()
-        try:
-            position = session.query(Position).filter(Position.position_id == position_id).first()
-            if not position:
-                return False, "Position not found."
-            self._log_audit(
-                session,
-                "Position deleted",
-                f"Position deleted: {position.title} (id: {position.position_id})",
-                None,
-            )
-            session.delete(position)
-            session.commit()
-            return True, "Position deleted successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to delete position: {str(e)}"
-        finally:
-            session.close()
+        with self._session() as session:
+            try:
+                position = session.query(Position).filter(Position.position_id == position_id).first()
+                if not position:
+                    return False, "Position not found."
+                self._log_audit(
+                    session,
+                    "Position deleted",
+                    f"Position deleted: {position.title} (id: {position.position_id})",
+                    None,
+                )
+                session.delete(position)
+                session.commit()
+                return True, "Position deleted successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to delete position: {str(e)}"
     
     def get_candidates_by_position(self, position_id: int) -> list[dict]:
         """Get candidates for a specific position."""
-        session = get_session()
-        try:
+        with self._session() as session:
             candidates = session.query(Candidate).filter(
                 Candidate.position_id == position_id
             ).order_by(Candidate.full_name).all()
             return [c.to_dict() for c in candidates]
-        finally:
-            session.close()
     
     def assign_candidate_to_position(self, candidate_id: int, position_id: int) -> tuple[bool, str]:
         """Assign a candidate to a position."""
-        session = get_session()
-        try:
-            candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
-            if not candidate:
-                return False, "Candidate not found."
+        with self._session() as session:
+            try:
+                candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
+                if not candidate:
+                    return False, "Candidate not found."
             
-            position = session.query(Position).filter(Position.position_id == position_id).first()
-            if not position:
-                return False, "Position not found."
+                position = session.query(Position).filter(Position.position_id == position_id).first()
+                if not position:
+                    return False, "Position not found."
             
-            candidate.position_id = position_id
-            # Also update legacy position text
-            candidate.position = position.title
-            self._log_audit(
-                session,
-                "Candidate assigned",
-                f"Candidate assigned: {candidate.full_name} → {position.title}",
-                None,
-            )
-            session.commit()
-            return True, "Candidate assigned to position successfully!"
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to assign candidate: {str(e)}"
-        finally:
-            session.close()
+                candidate.position_id = position_id
+                # Also update legacy position text
+                candidate.position = position.title
+                self._log_audit(
+                    session,
+                    "Candidate assigned",
+                    f"Candidate assigned: {candidate.full_name} → {position.title}",
+                    None,
+                )
+                session.commit()
+                return True, "Candidate assigned to position successfully!"
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to assign candidate: {str(e)}"
+    
+    def create_ballot_bulk(self, election_id: int, positions: list[dict]) -> tuple[bool, str, list[int]]:
+        """
+        Create several positions and their candidate assignments in a single transaction.
+        positions: list of {"title": str, "display_order": int, "candidate_ids": list[int]}
+        """
+        with self._session() as session:
+            try:
+                # Resolve every assigned candidate up front: unknown IDs fail the whole
+                # ballot, and the names feed the per-candidate audit rows below
+                all_ids = {cid for pos_data in positions for cid in (pos_data.get("candidate_ids") or [])}
+                names = {}
+                if all_ids:
+                    names = dict(
+                        session.query(Candidate.candidate_id, Candidate.full_name)
+                        .filter(Candidate.candidate_id.in_(all_ids))
+                        .all()
+                    )
+                    if len(names) != len(all_ids):
+                        return False, "Candidate not found.", []
+
+                created = []
+                for idx, pos_data in enumerate(positions):
+                    position = Position(
+                        election_id=election_id,
+                        title=(pos_data.get("title") or "").strip(),
+                        display_order=pos_data.get("display_order", idx)
+                    )
+                    session.add(position)
+                    created.append((position, list(pos_data.get("candidate_ids") or [])))
+
+                # Flush once so every new position has its ID before assigning candidates
+                session.flush()
+
+                for position, candidate_ids in created:
+                    self._log_audit(
+                        session,
+                        "Position created",
+                        f"Position created: {position.title} (election_id: {election_id})",
+                        None,
+                    )
+                    if candidate_ids:
+                        session.query(Candidate).filter(
+                            Candidate.candidate_id.in_(candidate_ids)
+                        ).update(
+                            {Candidate.position_id: position.position_id, Candidate.position: position.title},
+                            synchronize_session=False
+                        )
+                        for cid in candidate_ids:
+                            self._log_audit(
+                                session,
+                                "Candidate assigned",
+                                f"Candidate assigned: {names[cid]} → {position.title}",
+                                None,
+                            )
+
+                session.commit()
+                return True, "Ballot created successfully!", [p.position_id for p, _ in created]
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to create ballot: {str(e)}", []
     
     def get_election_ballot_data(self, election_id: int) -> dict:
         """Get complete ballot data for an election (positions with candidates)."""
-        session = get_session()
-        try:
+        with self._session() as session:
             election = session.query(Election).filter(Election.election_id == election_id).first()
             if not election:
                 return {"election": None, "positions": []}
@@ -1435,68 +1489,63 @@ class Database:
                 })
             
             return ballot_data
-        finally:
-            session.close()
     
     def cast_ballot_votes(self, user_id: int, election_id: int, votes: list[dict]) -> tuple[bool, str]:
         """
         Cast votes for multiple positions in a single ballot.
         votes: list of {"position_id": int, "candidate_id": int}
         """
-        session = get_session()
-        try:
-            # Allow partial ballots: only block duplicates per position.
-            for vote in votes:
-                position_id = vote.get("position_id")
-                if position_id is None:
-                    continue
-                existing = session.query(VotingRecord).filter(
-                    and_(
-                        VotingRecord.user_id == user_id,
-                        VotingRecord.election_id == election_id,
-                        VotingRecord.position_id == position_id,
-                    )
-                ).first()
-                if existing:
-                    return False, "You have already voted for one or more positions in this election."
+        with self._session() as session:
+            try:
+                # Allow partial ballots: only block duplicates per position.
+                for vote in votes:
+                    position_id = vote.get("position_id")
+                    if position_id is None:
+                        continue
+                    existing = session.query(VotingRecord).filter(
+                        and_(
+                            VotingRecord.user_id == user_id,
+                            VotingRecord.election_id == election_id,
+                            VotingRecord.position_id == position_id,
+                        )
+                    ).first()
+                    if existing:
+                        return False, "You have already voted for one or more positions in this election."
             
-            # Create voting records for each position
-            for vote in votes:
-                position_id = vote.get("position_id")
-                candidate_id = vote.get("candidate_id")
+                # Create voting records for each position
+                for vote in votes:
+                    position_id = vote.get("position_id")
+                    candidate_id = vote.get("candidate_id")
 
-                status = 'cast' if candidate_id else 'spoiled'
+                    status = 'cast' if candidate_id else 'spoiled'
                 
-                record = VotingRecord(
-                    user_id=user_id,
-                    election_id=election_id,
-                    position_id=position_id,
-                    candidate_id=candidate_id,
-                    status=status
-                )
-                session.add(record)
+                    record = VotingRecord(
+                        user_id=user_id,
+                        election_id=election_id,
+                        position_id=position_id,
+                        candidate_id=candidate_id,
+                        status=status
+                    )
+                    session.add(record)
                 
-                # Update candidate vote count
-                if candidate_id and status == 'cast':
-                    candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
-                    if candidate:
-                        candidate.vote_count = (candidate.vote_count or 0) + 1
+                    # Update candidate vote count
+                    if candidate_id and status == 'cast':
+                        candidate = session.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
+                        if candidate:
+                            candidate.vote_count = (candidate.vote_count or 0) + 1
             
-            session.commit()
-            return True, "Ballot submitted successfully!"
-        except IntegrityError:
-            session.rollback()
-            return False, "You have already voted for one or more positions in this election."
-        except Exception as e:
-            session.rollback()
-            return False, f"Failed to submit ballot: {str(e)}"
-        finally:
-            session.close()
+                session.commit()
+                return True, "Ballot submitted successfully!"
+            except IntegrityError:
+                session.rollback()
+                return False, "You have already voted for one or more positions in this election."
+            except Exception as e:
+                session.rollback()
+                return False, f"Failed to submit ballot: {str(e)}"
     
     def has_user_voted_position(self, user_id: int, election_id: int, position_id: int) -> bool:
         """Check if user has voted for a specific position."""
-        session = get_session()
-        try:
+        with self._session() as session:
             record = session.query(VotingRecord).filter(
                 and_(
                     VotingRecord.user_id == user_id,
@@ -1505,13 +1554,10 @@ class Database:
                 )
             ).first()
             return record is not None
-        finally:
-            session.close()
     
     def get_user_ballot_status(self, user_id: int, election_id: int) -> dict:
         """Get user's voting status for all positions in an election."""
-        session = get_session()
-        try:
+        with self._session() as session:
             # Get all positions for the election
             positions = session.query(Position).filter(
                 Position.election_id == election_id
@@ -1535,13 +1581,10 @@ class Database:
                 "completed": voted_count == total_positions and total_positions > 0,
                 "voted_position_ids": list(voted_positions)
             }
-        finally:
-            session.close()
     
     def get_election_results_by_position(self, election_id: int) -> dict:
         """Get election results grouped by position."""
-        session = get_session()
-        try:
+        with self._session() as session:
             election = session.query(Election).filter(Election.election_id == election_id).first()
             if not election:
                 return {"election": None, "positions": [], "total_votes": 0}
@@ -1627,8 +1670,6 @@ class Database:
                 })
             
             return results
-        finally:
-            session.close()
     
     # Legacy method aliases
     def validate_login(self, username: str, student_id: str, password: str) -> tuple[bool, str]:
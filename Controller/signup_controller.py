@@ -1,13 +1,14 @@
 
 import re
-from Models.model_db import Database
+from Models.model_db import db
+from Controller.controller_voters import register_user
 
 
 class SignupController:
     def __init__(self, view, login_view=None):
         self.view = view
         self.login_view = login_view
-        self.db = Database()
+        self.db = db
         self.view.register_btn.clicked.connect(self.handle_signup)
 
         # Connect navigation back to login if label exists
@@ -71,4 +72,4 @@ class SignupController:
             return
 
         # Register user in database using Database service
-        success, message = self.db.register_user(full_name, email, student_id, password)
+        success, message = register_user(full_name, email, student_id, password)
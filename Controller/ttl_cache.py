@@ -0,0 +1,44 @@
+"""
+Small in-process TTL cache for read-heavy controller calls.
+
+Dashboard refreshes fire several identical reads back-to-back; caching them for a
+few seconds keeps the UI snappy without holding stale data for long.
+"""
+import time
+from functools import wraps
+
+
+def _copy(value):
+    """Shallow-copy a cached list/dict (and the dicts in a list) for one caller."""
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def ttl_cache(ttl: float = 3.0):
+    """Cache a function's results per argument tuple for `ttl` seconds.
+
+    Each caller gets its own shallow copy, so annotating a returned row does not
+    leak into the cache. The wrapped function gains a `cache_clear()` method for
+    write paths.
+    """
+    def decorator(func):
+        cache: dict = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and hit[0] > now:
+                return _copy(hit[1])
+            value = func(*args, **kwargs)
+            cache[key] = (now + ttl, value)
+            return _copy(value)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -4,9 +4,10 @@ SQLAlchemy Base configuration and database session management.
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
-from config import DB_CONFIG
+from config import DB_CONFIG, DB_POOL_SIZE
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.pooling import MySQLConnectionPool
 
 # Create database URL from config
 DATABASE_URL = f"mysql+mysqlconnector://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
@@ -95,6 +96,17 @@ def _run_migrations():
             "ALTER TABLE candidates ADD COLUMN position VARCHAR(128) DEFAULT NULL",
             "ALTER TABLE candidates ADD COLUMN position_id INT NULL AFTER election_id",
             "ALTER TABLE elections ADD COLUMN status_locked TINYINT(1) DEFAULT 0",
+            # Login lookups (create_all does not add indexes to pre-existing tables)
+            "CREATE INDEX idx_username ON users (username)",
+            "CREATE INDEX idx_student_id ON users (student_id)",
+            # Supports ORDER BY full_name / keyset paging of an election's candidates
+            "CREATE INDEX idx_candidates_election_name ON candidates (election_id, full_name)",
+            # Per-election candidate tallies (reports, results, dashboard charts)
+            "CREATE INDEX idx_vr_elec_cand ON voting_records (election_id, candidate_id)",
+            # Eligible-voter counts filter students by grade and section
+            "CREATE INDEX idx_users_elig ON users (role, grade_level, section)",
+            # Latest vote per user (voter list status column)
+            "CREATE INDEX idx_vr_user_voted ON voting_records (user_id, voted_at)",
         ]
         
         for migration in migrations:
@@ -195,18 +207,32 @@ def _run_migrations():
         session.close()
 
 
-# Legacy support - keep get_connection for backward compatibility with controllers
-def get_connection():
-    """Legacy: Create and return a MySQL database connection."""
-    try:
-        connection = mysql.connector.connect(
+# Raw connection pool for controllers that use get_connection(). Created lazily
+# because the database itself may not exist until init_db() has run.
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = MySQLConnectionPool(
+            pool_name="eduvote",
+            pool_size=DB_POOL_SIZE,
+            pool_reset_session=True,
             host=DB_CONFIG['host'],
             user=DB_CONFIG['user'],
             password=DB_CONFIG['password'],
             database=DB_CONFIG['database'],
             port=DB_CONFIG['port']
         )
-        return connection
+    return _pool
+
+
+# Legacy support - keep get_connection for backward compatibility with controllers
+def get_connection():
+    """Legacy: Return a pooled MySQL connection; close() hands it back to the pool."""
+    try:
+        return _get_pool().get_connection()
     except Error as e:
         print(f"Error connecting to MySQL: {e}")
         return None
@@ -1,7 +1,23 @@
 """Compatibility shim for the database service layer.
 
 Database logic now lives in Controller.database_service to keep Models focused on ORM.
+``db`` is the process-wide Database instance shared by the controllers; it is
+created on first access since constructing Database bootstraps the schema.
 """
 from Controller.database_service import Database
 
-__all__ = ["Database"]
+__all__ = ["Database", "db"]
+
+# Declared for static tools; the value is supplied lazily by __getattr__ below
+db: Database
+
+_shared_db = None
+
+
+def __getattr__(name):
+    global _shared_db
+    if name == "db":
+        if _shared_db is None:
+            _shared_db = Database()
+        return _shared_db
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
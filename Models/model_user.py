@@ -1,7 +1,6 @@
 """
 User Model - SQLAlchemy ORM model for users table.
 """
-import hashlib
 from sqlalchemy import Column, Integer, String, Enum, TIMESTAMP, Index, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -31,6 +30,7 @@ class User(Base):
     __table_args__ = (
         Index('idx_username', 'username'),
         Index('idx_student_id', 'student_id'),
+        Index('idx_users_elig', 'role', 'grade_level', 'section'),
     )
 
     def __repr__(self):
@@ -38,12 +38,15 @@ class User(Base):
 
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password the same way the service layer stores it (bcrypt)."""
+        # Imported here: the service layer imports this model at module load
+        from Controller.database_service import Database
+        return Database.hash_password(password)
 
     def check_password(self, password: str) -> bool:
-        """Verify password against stored hash."""
-        return self.password_hash == self.hash_password(password)
+        """Verify password against stored hash (bcrypt or legacy SHA-256)."""
+        from Controller.database_service import Database
+        return Database._verify_password(password, self.password_hash)
 
     def to_dict(self) -> dict:
         """Convert user to dictionary."""
@@ -1,7 +1,7 @@
 """
 VotingRecord Model - SQLAlchemy ORM model for voting_records table.
 """
-from sqlalchemy import Column, Integer, Enum, TIMESTAMP, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, Enum, TIMESTAMP, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from Models.base import Base
@@ -28,6 +28,8 @@ class VotingRecord(Base):
     # Unique constraint - prevents duplicate votes per user per election per position
     __table_args__ = (
         UniqueConstraint('user_id', 'election_id', 'position_id', name='uniq_user_election_position'),
+        Index('idx_vr_elec_cand', 'election_id', 'candidate_id'),
+        Index('idx_vr_user_voted', 'user_id', 'voted_at'),
     )
 
     def __repr__(self):
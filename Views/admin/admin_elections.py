@@ -18,9 +18,10 @@ from Controller.controller_elections import (
     delete_election,
     set_election_status,
     get_positions_for_election,
-    create_position,
     delete_position,
     get_election_ballot_data,
+    assign_candidate_to_position,
+    create_ballot_bulk,
 )
 from Controller.controller_candidates import list_candidates as list_all_candidates
 from Controller.controller_voters import list_sections as list_sections_lookup, add_section as add_new_section
@@ -981,9 +982,6 @@ class ManageElectionsPage(QWidget):
 
     def _save_positions(self, election_id: int, positions_data: list):
         """Save positions and candidate assignments for an election."""
-        from Models.model_db import Database
-        db = Database()
-
         # Get existing positions
         existing_positions = get_positions_for_election(election_id) or []
         existing_ids = {
@@ -993,6 +991,7 @@ class ManageElectionsPage(QWidget):
         }
 
         new_position_ids = set()
+        new_positions = []
         for idx, pos_data in enumerate(positions_data):
             pos_id = pos_data.get('position_id')
             title = pos_data.get('title', '')
@@ -1003,17 +1002,24 @@ class ManageElectionsPage(QWidget):
                 from Controller.controller_elections import update_position
                 update_position(pos_id, title, idx)
                 new_position_ids.add(pos_id)
-            else:
-                # Create new position
-                ok, msg, new_pos_id = create_position(election_id, title, idx)
-                if ok and new_pos_id:
-                    pos_id = new_pos_id
-                    new_position_ids.add(pos_id)
-
-            # Assign candidates to position
-            if pos_id:
+
+                # Assign candidates to position
                 for cid in candidate_ids:
-                    db.assign_candidate_to_position(cid, pos_id)
+                    assign_candidate_to_position(cid, pos_id)
+            else:
+                # New positions (and their candidates) are created together below
+                new_positions.append({
+                    'title': title,
+                    'display_order': idx,
+                    'candidate_ids': candidate_ids,
+                })
+
+        if new_positions:
+            ok, msg, _ = create_ballot_bulk(election_id, new_positions)
+            if not ok:
+                # Nothing new was saved; keep the old positions rather than half-applying the edit
+                QMessageBox.warning(self, "Error", msg)
+                return
 
         # Delete removed positions
         for old_id in existing_ids - new_position_ids:
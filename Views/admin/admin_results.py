@@ -10,7 +10,7 @@ import os
 
 # Update these imports to match your project structure
 from .admin_components import StatusBadge, DataTable, BarChart, PieChart, WinnerBanner
-from Models.model_db import Database
+from Models.model_db import db
 from Controller.controller_reports import (
     get_full_election_report_data, 
     generate_csv_report, 
@@ -59,7 +59,7 @@ class AdminResultsPage(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.db = Database()
+        self.db = db
         self._candidates = []
         self._position_results: dict | None = None
         self.elections = []
@@ -897,7 +897,7 @@ class AdminResultsPage(QWidget):
         election_id = election.get("election_id")
         election_title = election.get("title", "Election").replace(" ", "_")
 
-        report_data = get_full_election_report_data(election_id)
+        report_data = get_full_election_report_data(election_id, include_records=False)
 
         if not report_data.get("success"):
             QMessageBox.warning(self, "Error", report_data.get("error", "Failed to get report data."))
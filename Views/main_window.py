@@ -14,11 +14,11 @@ from Views.views_candidate import CandidatesPage
 from Views.views_results import ResultsPage
 from Controller.controller_voters import (
     get_user_by_id, update_user_profile, get_user_voting_history,
-    has_user_voted, cast_vote
+    has_user_voted, cast_vote, cast_ballot_votes
 )
 from Controller.controller_elections import get_election_results
 from Controller.controller_candidates import get_candidates_for_election
-from Models.model_db import Database
+from Models.model_db import db
 from Models.validators import is_valid_optional_email
 
 
@@ -266,7 +266,6 @@ class MainWindow(QMainWindow):
 
     def _load_election_data(self):
         user_id = self.user_data.get("id") or self.user_data.get("user_id")
-        db = Database()
         elections = db.get_user_allowed_elections(user_id) if user_id else []
 
         blocks = []
@@ -360,8 +359,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Votes", "No votes were selected.")
             return
 
-        db = Database()
-        success, message = db.cast_ballot_votes(user_id, election_id, votes)
+        success, message = cast_ballot_votes(user_id, election_id, votes)
         
         if success:
             vote_count = len(votes)
@@ -6,7 +6,7 @@ from PyQt6.QtGui import QFont, QColor, QPainter, QBrush
 from PyQt6.QtCore import Qt
 from Views.components import CircularImageAvatar
 from Controller.controller_elections import get_election_results, get_election_results_by_position
-from Models.model_db import Database
+from Models.model_db import db
 
 
 class ProgressBar(QWidget):
@@ -499,7 +499,6 @@ class ResultsPage(QWidget):
 
     def _load_elections(self):
         user_id = self.user_data.get("id") or self.user_data.get("user_id")
-        db = Database()
         self.elections = db.get_user_allowed_elections(user_id) if user_id else db.get_all_elections()
 
         self.election_selector.blockSignals(True)
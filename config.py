@@ -1,3 +1,4 @@
+import os
 
 DB_CONFIG = {
     'host': 'localhost',
@@ -7,3 +8,8 @@ DB_CONFIG = {
     'port': 3306
 }
 
+# Size of the raw mysql.connector pool used by Models.base.get_connection()
+DB_POOL_SIZE = int(os.environ.get('EDUVOTE_DB_POOL_SIZE', '10'))
+
+# bcrypt work factor for new password hashes (each +1 doubles the hashing cost)
+BCRYPT_ROUNDS = int(os.environ.get('EDUVOTE_BCRYPT_ROUNDS', '12'))